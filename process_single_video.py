@@ -188,7 +188,7 @@ Content: {content}"""
             'primary_model': os.getenv('PRIMARY_MODEL', 'openai/gpt-4o'),
             'secondary_model': os.getenv('SECONDARY_MODEL', 'anthropic/claude-3.5-sonnet'),
             'synthesis_model': os.getenv('SYNTHESIS_MODEL', 'deepseek/deepseek-chat-v3-0324'),
-            'cost_threshold_tokens': int(os.getenv('COST_THRESHOLD_TOKENS', '50000')),
+            'cost_threshold_tokens': int(os.getenv('COST_THRESHOLD_TOKENS')) if os.getenv('COST_THRESHOLD_TOKENS') else None,
             'fallback_strategy': os.getenv('FALLBACK_STRATEGY', 'best_summary'),
         }
         
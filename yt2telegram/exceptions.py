@@ -26,6 +26,14 @@ class TelegramAPIError(NetworkError):
     """Raised when Telegram API operations fail."""
     pass
 
+class TelegramPermanentError(TelegramAPIError):
+    """Raised when Telegram refuses a bot outright (bad token, bot blocked, chat not found)."""
+    pass
+
+class TelegramParseError(TelegramAPIError):
+    """Raised when Telegram rejects a message's formatting (can't parse entities)."""
+    pass
+
 class LLMError(NetworkError):
     """Raised when LLM operations fail."""
     pass
@@ -54,4 +62,12 @@ class MembersFirstError(YouTubeAPIError):
     """
     def __init__(self, message: str, release_timestamp: int = None):
         super().__init__(message)
-        self.release_timestamp = release_timestamp
\ No newline at end of file
+        self.release_timestamp = release_timestamp
+
+class CircuitOpenError(LLMError):
+    """Raised when a call is skipped because the model's circuit breaker is open."""
+    pass
+
+class DeadlineExceededError(LLMError):
+    """Raised when a call is skipped because the pipeline's time budget is spent."""
+    pass
@@ -106,7 +106,8 @@ def process_channel(config: ChannelConfig) -> bool:
             retry_attempts=config.retry_attempts,
             retry_delay_seconds=config.retry_delay_seconds
         )
-        telegram_service = TelegramService(bot_configs=config.telegram_bots_config)
+        telegram_service = TelegramService(bot_configs=config.telegram_bots_config,
+                                           message_format=config.telegram_format)
         
         # Initialize appropriate LLM service based on configuration
         multi_model_config = config.llm_config.get('multi_model', {})
@@ -135,6 +136,7 @@ def process_channel(config: ChannelConfig) -> bool:
         processed_count = 0
         successful_count = 0
         failed_count = 0
+        pending_notifications = []
         
         for video in videos:
             logger.info("Processing video", video_id=video.id, video_title=video.title, published_date=video.published_at)
@@ -257,25 +259,30 @@ def process_channel(config: ChannelConfig) -> bool:
             # AI-DECISION: Notification delivery strategy
             # Criteria: Use generic formatting that works for all channels
             # Channel-specific customization should be configuration-driven
-            telegram_success = False
+            # Delivery runs in the background while the next video is downloaded and
+            # summarized; results are collected once the channel's videos are done
+            processed_count += 1
             if summary:
-                try:
-                    telegram_service.send_video_notification(
-                        config.name,
-                        video.title,
-                        video.id,
-                        summary,
-                        video.published_at
-                    )
-                    telegram_success = True
-                    logger.info("Successfully sent Telegram notification", video_id=video.id)
-                except Exception as e:
-                    logger.error("Failed to send Telegram notification", error=str(e), video_id=video.id)
-                    telegram_success = False
+                pending_notifications.append((video, telegram_service.submit_video_notification(
+                    config.name,
+                    video.title,
+                    video.id,
+                    summary,
+                    video.published_at
+                )))
             else:
                 logger.warning("No summary available, skipping Telegram notification", video_id=video.id)
+                failed_count += 1
+                logger.error("Processed video but failed to send notification", video_id=video.id, video_title=video.title)
 
-            processed_count += 1
+        # Wait for the queued notifications so this channel's counts are complete
+        for video, notification in pending_notifications:
+            try:
+                telegram_success = notification.result()
+            except Exception as e:
+                logger.error("Failed to send Telegram notification", error=str(e), video_id=video.id)
+                telegram_success = False
+            
             if telegram_success:
                 successful_count += 1
                 logger.info("Successfully processed and sent video", video_id=video.id, video_title=video.title)
@@ -35,6 +35,7 @@ class ChannelConfig:
         cookies_file (Optional[str]): Path to YouTube cookies for authentication
         subtitle_preferences (List[str]): Language codes in preference order
         telegram_bots_config (List[Dict]): Bot configurations for message delivery
+        telegram_format (Dict[str, str]): Optional notification header/footer overrides
         llm_config (Dict[str, Any]): Complete LLM configuration including multi-model
         retry_attempts (int): Number of retry attempts for failed operations
         retry_delay_seconds (int): Base delay between retry attempts
@@ -60,6 +61,7 @@ class ChannelConfig:
     
     # Service configurations
     telegram_bots_config: List[Dict] = None  # Bot delivery settings
+    telegram_format: Dict[str, str] = None  # Notification header/footer overrides
     llm_config: Dict[str, Any] = None  # AI model configuration
     
     # Operational parameters
@@ -71,6 +73,8 @@ class ChannelConfig:
             self.subtitle_preferences = []
         if self.telegram_bots_config is None:
             self.telegram_bots_config = []
+        if self.telegram_format is None:
+            self.telegram_format = {}
         if self.llm_config is None:
             self.llm_config = {}
     
@@ -93,6 +97,7 @@ class ChannelConfig:
             cookies_file=data.get('cookies_file'),
             subtitle_preferences=cls._extract_subtitle_languages(data.get('subtitles', [])),
             telegram_bots_config=data.get('telegram_bots', []),
+            telegram_format=data.get('telegram_format', {}),
             llm_config=data.get('llm_config', {}),
             retry_attempts=data.get('retry_attempts', 3),
             retry_delay_seconds=data.get('retry_delay_seconds', 5)
@@ -34,14 +34,14 @@ class QnAHandler:
         if not latest_videos:
             return "No videos found in the database."
         
-        response = "📺 **Latest Videos:**\n\n"
+        lines = ["📺 **Latest Videos:**\n\n"]
         for video in latest_videos:
-            response += f"**{video['title']}**\n"
-            response += f"📅 {video['upload_date']}\n"
-            response += f"📝 {video['summary'][:200]}...\n"
-            response += f"🔗 [Watch]({video['url']})\n\n"
+            lines.append(f"**{video['title']}**\n")
+            lines.append(f"📅 {video['upload_date']}\n")
+            lines.append(f"📝 {video['summary'][:200]}...\n")
+            lines.append(f"🔗 [Watch]({video['url']})\n\n")
         
-        return response
+        return "".join(lines)
     
     def search_content(self, query: str) -> str:
         """Search for specific content."""
@@ -50,33 +50,33 @@ class QnAHandler:
         if not results:
             return f"No results found for '{query}'."
         
-        response = f"🔍 **Search Results for '{query}':**\n\n"
+        lines = [f"🔍 **Search Results for '{query}':**\n\n"]
         
         for result in results[:3]:  # Limit to 3 results
-            response += f"**{result['title']}**"
+            lines.append(f"**{result['title']}**")
             if result['type'] == 'subtitle':
-                response += f" (at {result.get('timestamp', 'N/A')})"
-            response += "\n"
+                lines.append(f" (at {result.get('timestamp', 'N/A')})")
+            lines.append("\n")
             
             content = result['content'][:150]
             if len(result['content']) > 150:
                 content += "..."
-            response += f"{content}\n"
-            response += f"🔗 [Watch]({result['url']})\n\n"
+            lines.append(f"{content}\n")
+            lines.append(f"🔗 [Watch]({result['url']})\n\n")
         
-        return response
+        return "".join(lines)
     
     def _prepare_context(self, search_results: List[Dict[str, Any]]) -> str:
         """Prepare context from search results."""
-        context = "Relevant content found:\n\n"
+        lines = ["Relevant content found:\n\n"]
         
         for result in search_results:
-            context += f"Title: {result['title']}\n"
-            context += f"Type: {result['type']}\n"
-            context += f"Content: {result['content'][:500]}...\n"
-            context += f"URL: {result['url']}\n\n"
+            lines.append(f"Title: {result['title']}\n")
+            lines.append(f"Type: {result['type']}\n")
+            lines.append(f"Content: {result['content'][:500]}...\n")
+            lines.append(f"URL: {result['url']}\n\n")
         
-        return context
+        return "".join(lines)
     
     def _generate_answer(self, question: str, context: str) -> str:
         """Generate answer using OpenRouter API."""
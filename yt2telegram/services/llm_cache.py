@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Protocol
+
+from ..utils.json_utils import dumps, loads
+from ..utils.logging_config import LoggerFactory
+
+logger = LoggerFactory.create_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for LLMCache entries"""
+
+    def get(self, key: str) -> Optional[dict]:
+        ...
+
+    def set(self, key: str, entry: dict):
+        ...
+
+
+class MemoryBackend:
+    """Process-local cache backend (lost on exit)"""
+
+    def __init__(self):
+        self._entries: Dict[str, dict] = {}
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: dict):
+        self._entries[key] = entry
+
+
+class FileBackend:
+    """One JSON file per entry, sharded by key prefix so directories stay small"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            return loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("LLM cache entry unreadable", key=key, error=str(e))
+            return None
+
+    def set(self, key: str, entry: dict):
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(dumps(entry), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("LLM cache store failed", key=key, error=str(e))
+
+
+# @agent:service-type data-access
+# @agent:scalability vertical
+# @agent:persistence file_system
+# @agent:priority optional
+# @agent:dependencies FileSystem
+class LLMCache:
+    """Exact-match cache for individual chat completion responses.
+
+    Keyed on the full request (model, messages, temperature), so a hit means the
+    provider would be asked the identical question again - re-runs, reprocessing
+    after a failed Telegram delivery, or a retry after synthesis failed. Unlike
+    SummaryCache, which short-circuits the whole pipeline for near-duplicate
+    transcripts, this caches each model call separately.
+
+    Critical Path: Optional - backend errors are logged and treated as misses
+
+    Example:
+        >>> cache = LLMCache(FileBackend(".cache/llm"), ttl_seconds=86400)
+        >>> key = cache.cache_key("gpt-4o-mini", messages, 0.7)
+        >>> cached = cache.get(key)
+        >>> if cached is None:
+        ...     cache.set(key, {"text": summary, "usage": usage_info})
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: Optional[float] = 86400):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def cache_key(model: str, messages: list, temperature: float) -> str:
+        """Deterministic key for a chat completion request"""
+        payload = {'model': model, 'messages': messages, 'temperature': temperature}
+        # Canonical JSON (sorted keys) so equal requests always hash the same
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: dict):
+        """Store value under key"""
+        self.backend.set(key, {'created_at': time.time(), 'value': value})
+
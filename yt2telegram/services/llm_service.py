@@ -1,14 +1,96 @@
 import os
-from typing import Dict
+import threading
+from typing import Dict, Tuple
 from pathlib import Path
 
+import httpx
 import openai
 from openai import OpenAI
-from ..utils.retry import api_retry
+from ..utils.retry import retry, RetryConfig
 from ..utils.logging_config import LoggerFactory
 
+# HTTP/2 support in httpx needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = LoggerFactory.create_logger(__name__)
 
+# OpenAI clients shared by every service instance, keyed by (api_key, base_url),
+# so channels hitting the same provider reuse one connection pool
+_CLIENTS: Dict[Tuple[str, str], OpenAI] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Connection pool for shared clients: one pool serves every channel and the
+# concurrent primary/secondary calls; capped so bursts cannot exhaust sockets
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# Request-level retries inside the SDK: 408/409/429/5xx and connection errors,
+# with backoff that honours Retry-After. Only the failed HTTP request is resent.
+_SDK_MAX_RETRIES = 2
+
+# Whole-call retries on top of the SDK's. An HTTP error status that reaches this
+# level either already exhausted the SDK retries or will never succeed
+# (400/401/404), so it fails fast instead of multiplying attempts and sleeps.
+_LLM_RETRY = dict(
+    RetryConfig.EXTERNAL_API,
+    attempts=2,
+    fail_fast=RetryConfig.EXTERNAL_API['fail_fast'] + (openai.APIStatusError,)
+)
+
+# Prompt template file contents by path, with the mtime they were read at
+_TEMPLATES: Dict[str, Tuple[int, str]] = {}
+
+# The system message is identical for every call - build it once
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert content analyst who creates comprehensive, detailed summaries while preserving the original author's voice and style."
+}
+
+
+def load_template(path: str) -> str:
+    """Read a prompt template file, cached so channels sharing a template read it once.
+    
+    The cache entry is keyed on the file's mtime, so an edited template is picked
+    up by the next service instance without restarting the process.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _TEMPLATES.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        template = f.read()
+    _TEMPLATES[path] = (mtime, template)
+    return template
+
+
+def get_shared_client(api_key: str, base_url: str) -> Tuple[OpenAI, bool]:
+    """Return the process-wide client for a provider and whether this call created it.
+    
+    Clients use keep-alive pooling and HTTP/2 when h2 is installed, so repeated
+    calls to the same host skip the TCP and TLS handshakes. Transient HTTP
+    failures are retried by the SDK itself (see _SDK_MAX_RETRIES).
+    """
+    client_key = (api_key, base_url)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(client_key)
+        if client is not None:
+            return client, False
+        http_client = httpx.Client(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client,
+                        max_retries=_SDK_MAX_RETRIES)
+        _CLIENTS[client_key] = client
+        return client, True
+
+
+def llm_retry(func):
+    """Retry decorator for LLM calls made through a shared client (see _LLM_RETRY)"""
+    return retry(**_LLM_RETRY)(func)
+
+
 # @agent:service-type business-logic
 # @agent:scalability stateless
 # @agent:persistence none
@@ -47,7 +129,7 @@ class LLMService:
         
     Note:
         Thread-safe for concurrent summarization. Supports OpenAI-compatible APIs.
-        Automatic retry logic through @api_retry decorator.
+        Transient HTTP errors are retried by the SDK, other failures through @llm_retry.
     """
     
     def __init__(self, llm_config: Dict):
@@ -85,8 +167,7 @@ class LLMService:
         llm_prompt_template_path = llm_config.get('llm_prompt_template_path')
         if llm_prompt_template_path:
             try:
-                with open(llm_prompt_template_path, 'r', encoding='utf-8') as f:
-                    self.prompt_template = f.read()
+                self.prompt_template = load_template(llm_prompt_template_path)
             except FileNotFoundError:
                 raise ValueError(f"LLM prompt template file not found: {llm_prompt_template_path}")
         else:
@@ -94,9 +175,9 @@ class LLMService:
                 "Summarize the following YouTube video content. Focus on main topics, key points, and important takeaways.\n\nContent: {content}"
             )
 
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.client, _ = get_shared_client(self.api_key, self.base_url)
 
-    @api_retry
+    @llm_retry
     def summarize(self, content: str) -> str:
         """Generate summary of video content"""
         if not content:
@@ -115,7 +196,7 @@ class LLMService:
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are an expert content analyst who creates comprehensive, detailed summaries while preserving the original author's voice and style."},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ],
             max_tokens=2000,  # Increased back to 2000 - issue was Markdown parsing, not length
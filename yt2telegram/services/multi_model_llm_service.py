@@ -1,17 +1,232 @@
+import asyncio
 import os
 import time
-import json
-from typing import Dict, Optional, Tuple
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 import openai
 from openai import OpenAI
-from ..utils.retry import api_retry
+from ..exceptions import LLMError, CircuitOpenError, DeadlineExceededError
+from .summary_cache import SummaryCache
+from .llm_cache import LLMCache, FileBackend
+from .llm_service import get_shared_client, load_template, llm_retry
+from ..utils.circuit_breaker import get_circuit_breaker
+from ..utils.rate_limiter import TokenRateLimiter
+from ..utils.json_utils import dumps, loads
 from ..utils.logging_config import LoggerFactory
+from ..utils.text_similarity import term_vector, cosine_similarity, similarity_scores, split_passages
 # Multi-model result handling will be done through database service
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 logger = LoggerFactory.create_logger(__name__)
 
+# Rough characters-per-token ratio used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+# Rough per-token (input, output) USD pricing - should be updated with actual pricing.
+# Stored per token so the cost loop only multiplies (per-1K price / 1000).
+_MODEL_COSTS: Dict[str, Tuple[float, float]] = {
+    # OpenAI models
+    'gpt-4o': (2.5e-6, 1.0e-5),
+    'gpt-4o-mini': (1.5e-7, 6.0e-7),
+    'gpt-4': (3.0e-5, 6.0e-5),
+    'gpt-3.5-turbo': (1.5e-6, 2.0e-6),
+    
+    # Anthropic models
+    'anthropic/claude-3-opus': (1.5e-5, 7.5e-5),
+    'anthropic/claude-3-sonnet': (3.0e-6, 1.5e-5),
+    'anthropic/claude-3-haiku': (2.5e-7, 1.25e-6),
+}
+
+# Fallback pricing for models not in the table
+_DEFAULT_PRICING = (1.0e-6, 2.0e-6)
+
+# Batch API requests are billed at half the realtime price
+_BATCH_PRICE_FACTOR = 0.5
+
+# Prefix marking a model response that failed validation (checked by the pipeline)
+_FAILED_SUMMARY_PREFIX = "Summary generation failed"
+
+# Calls are skipped rather than started with less than this much pipeline budget left
+_MIN_CALL_SECONDS = 5.0
+
+# Summaries shorter than this are kept but logged as suspicious
+_MIN_SUMMARY_CHARS = 50
+
+# Worker pool for concurrent primary/secondary calls (see _get_pair_executor);
+# sized for a few videos in flight at once, two calls each
+_PAIR_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PAIR_EXECUTOR_LOCK = threading.Lock()
+_PAIR_EXECUTOR_WORKERS = 8
+
+# System prompts are identical for every call - keep them as shared constants
+_SYSTEM_PROMPT_SUMMARY = "You are an expert content analyst who creates comprehensive, detailed summaries while preserving the original author's voice and style."
+_SYSTEM_PROMPT_SYNTHESIS = "You are an expert synthesis specialist who combines multiple AI summaries into the highest quality final summary possible."
+
+# Pre-built system messages - the SDK only reads them, so one dict serves every request
+_SYSTEM_MESSAGE_SUMMARY = {"role": "system", "content": _SYSTEM_PROMPT_SUMMARY}
+_SYSTEM_MESSAGE_SYNTHESIS = {"role": "system", "content": _SYSTEM_PROMPT_SYNTHESIS}
+
+
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse a str.format-style template once into (literal, field_name) segments"""
+    return tuple((literal, field_name) for literal, field_name, _, _ in Formatter().parse(template))
+
+
+def _make_renderer(segments: Tuple[Tuple[str, Optional[str]], ...]) -> Callable[..., str]:
+    """Compile pre-parsed segments into a closure that only concatenates.
+    
+    The usual single-placeholder template becomes prefix + value + suffix; other
+    templates join their literals and keyword values in a fixed order.
+    """
+    segments = tuple(segments)
+    if len(segments) == 1 and segments[0][1] is None:
+        text = segments[0][0]
+        return lambda **fields: text
+    if len(segments) == 2 and segments[0][1] is not None and segments[1][1] is None:
+        (prefix, field_name), (suffix, _) = segments
+        return lambda **fields: prefix + fields[field_name] + suffix
+    
+    def render(**fields) -> str:
+        return ''.join([
+            literal + fields[field_name] if field_name is not None else literal
+            for literal, field_name in segments
+        ])
+    return render
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding once per process (None if unavailable)"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, using character heuristic", error=str(e))
+        return None
+
+
+def _token_length(text: str) -> int:
+    """Count tokens in text with tiktoken, or the character heuristic without it"""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=32)
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, cached so identical prompts are tokenized only once"""
+    return _token_length(text)
+
+
+def _bind_template(segments: Tuple[Tuple[str, Optional[str]], ...], fields: Dict[str, str]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Pre-render fields that never change into the literal text, merging adjacent literals"""
+    bound = []
+    pending = ''
+    for literal, field_name in segments:
+        pending += literal
+        if field_name is None:
+            continue
+        if field_name in fields:
+            pending += fields[field_name]
+        else:
+            bound.append((pending, field_name))
+            pending = ''
+    if pending:
+        bound.append((pending, None))
+    return tuple(bound)
+
+
+def _split_segments(segments: Tuple[Tuple[str, Optional[str]], ...], fields: Tuple[str, ...]):
+    """Split template segments before the first occurrence of any of the given fields"""
+    for index, (literal, field_name) in enumerate(segments):
+        if field_name in fields:
+            return segments[:index] + ((literal, None),), (('', field_name),) + segments[index + 1:]
+    return segments, ()
+
+
+def _extract_usage(response) -> dict:
+    """Extract token usage from a chat completion response (empty dict if not reported)"""
+    usage = getattr(response, 'usage', None)
+    if not usage:
+        return {}
+    usage_info = {
+        'prompt_tokens': usage.prompt_tokens,
+        'completion_tokens': usage.completion_tokens,
+        'total_tokens': usage.total_tokens
+    }
+    # OpenRouter reports the actual charged cost when usage accounting is requested
+    cost = getattr(usage, 'cost', None)
+    if cost is not None:
+        usage_info['cost'] = float(cost)
+    return usage_info
+
+
+def _model_pricing(model: str) -> Tuple[float, float]:
+    """Per-token (input, output) price for a model, accepting OpenRouter 'openai/' names"""
+    pricing = _MODEL_COSTS.get(model)
+    if pricing is None and model.startswith('openai/'):
+        pricing = _MODEL_COSTS.get(model[len('openai/'):])
+    return pricing or _DEFAULT_PRICING
+
+
+def _extract_usage_json(body: dict) -> dict:
+    """Extract token usage from a decoded chat completion JSON body (empty dict if not reported)"""
+    usage = body.get('usage')
+    if not usage:
+        return {}
+    usage_info = {
+        'prompt_tokens': usage.get('prompt_tokens', 0),
+        'completion_tokens': usage.get('completion_tokens', 0),
+        'total_tokens': usage.get('total_tokens', 0)
+    }
+    cost = usage.get('cost')
+    if cost is not None:
+        usage_info['cost'] = float(cost)
+    return usage_info
+
+
+def _message_text(body: dict) -> str:
+    """First choice's message text from a decoded chat completion JSON body"""
+    return (body['choices'][0]['message'].get('content') or '').strip()
+
+
+def _get_pair_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for primary/secondary calls, created on first use.
+    
+    Reused across videos and service instances so threads are not spawned and
+    joined for every video. Pair tasks never submit further work to the pool,
+    so a fixed size cannot deadlock.
+    """
+    global _PAIR_EXECUTOR
+    with _PAIR_EXECUTOR_LOCK:
+        if _PAIR_EXECUTOR is None:
+            _PAIR_EXECUTOR = ThreadPoolExecutor(max_workers=_PAIR_EXECUTOR_WORKERS, thread_name_prefix='llm-pair')
+        return _PAIR_EXECUTOR
+
+
+def _warm_up_client(client: OpenAI):
+    """Open a pooled connection to the provider so the first summary skips the handshake"""
+    try:
+        # Raw response - the model list itself is not needed, so skip parsing it
+        client.with_options(timeout=5.0, max_retries=0).models.with_raw_response.list()
+        logger.debug("Provider connection warmed up", base_url=str(client.base_url))
+    except Exception as e:
+        logger.debug("Provider connection warm-up failed", error=str(e))
+
+
 # @agent:service-type business-logic
 # @agent:scalability stateless
 # @agent:persistence none
@@ -42,7 +257,7 @@ class MultiModelLLMService:
         primary_model (str): Primary model for initial summarization
         secondary_model (str): Secondary model for alternative perspective
         synthesis_model (str): Model used for final summary synthesis
-        cost_threshold_tokens (int): Token limit before fallback activation
+        cost_threshold_tokens (Optional[int]): Token limit before fallback activation (None = unlimited)
         fallback_strategy (str): Strategy when cost limits exceeded
         
     Example:
@@ -76,6 +291,25 @@ class MultiModelLLMService:
         # Initialize OpenAI clients
         self._init_clients()
         
+        # Creator context depends only on immutable config - resolve it once
+        self._creator_context = self._resolve_creator_context()
+        
+        # Bake per-instance constants into the synthesis template, then split it at the
+        # first summary placeholder: everything before it is identical across retries
+        # of the same video and can be marked for prompt caching
+        bound_segments = _bind_template(self._synthesis_segments, {
+            'model_a': self.primary_model,
+            'model_b': self.secondary_model,
+            'creator_context': self._creator_context
+        })
+        self._synthesis_prefix_segments, self._synthesis_suffix_segments = _split_segments(
+            bound_segments, ('summary_a', 'summary_b'))
+        self._render_synthesis_prefix = _make_renderer(self._synthesis_prefix_segments)
+        self._render_synthesis_suffix = _make_renderer(self._synthesis_suffix_segments)
+        
+        # Fixed prompt text the pipeline sends on top of the transcript, for the cost check
+        self._prompt_overhead_tokens = self._count_prompt_overhead(bound_segments) if self.cost_threshold_tokens else 0
+        
         logger.info("MultiModelLLMService initialized", 
                    primary_model=self.primary_model,
                    secondary_model=self.secondary_model,
@@ -133,14 +367,17 @@ class MultiModelLLMService:
         llm_prompt_template_path = llm_config.get('llm_prompt_template_path')
         if llm_prompt_template_path:
             try:
-                with open(llm_prompt_template_path, 'r', encoding='utf-8') as f:
-                    self.prompt_template = f.read()
+                self.prompt_template = load_template(llm_prompt_template_path)
             except FileNotFoundError:
                 raise ValueError(f"LLM prompt template file not found: {llm_prompt_template_path}")
         else:
             self.prompt_template = llm_config.get('llm_prompt_template', 
                 "Summarize the following YouTube video content. Focus on main topics, key points, and important takeaways.\n\nContent: {content}"
             )
+        
+        # Parse the template once - rendering per video is then simple concatenation
+        self._prompt_segments = _compile_template(self.prompt_template)
+        self._render_prompt = _make_renderer(self._prompt_segments)
 
     def _init_multi_model_config(self, multi_model_config: Dict):
         """Initialize multi-model specific configuration"""
@@ -148,38 +385,187 @@ class MultiModelLLMService:
         self.secondary_model = multi_model_config.get('secondary_model', 'anthropic/claude-3-haiku')
         self.synthesis_model = multi_model_config.get('synthesis_model', 'gpt-4o')
         
-        self.cost_threshold_tokens = multi_model_config.get('cost_threshold_tokens', 50000)
+        # Pipeline role (also the usage-data key) -> model, for cost lookups
+        self._model_by_role = {
+            'primary': self.primary_model,
+            'secondary': self.secondary_model,
+            'synthesis': self.synthesis_model
+        }
+        # Role -> (model, input rate, output rate), resolved once per instance
+        self._pricing_by_role = {
+            role: (model_name,) + _model_pricing(model_name)
+            for role, model_name in self._model_by_role.items()
+        }
+        
+        # Opt-in: estimated pipeline tokens above this switch to fallback_strategy (None = no limit)
+        self.cost_threshold_tokens = multi_model_config.get('cost_threshold_tokens')
         self.fallback_strategy = multi_model_config.get('fallback_strategy', 'best_summary')
         
+        # Degenerate-content thresholds - below these no model is called at all
+        self.min_content_chars = multi_model_config.get('min_content_chars', 200)
+        self.min_distinct_words = multi_model_config.get('min_distinct_words', 20)
+        
+        # Synthesis strategy: 'llm' always synthesizes, 'select' picks the summary
+        # closest to the transcript and only synthesizes when the two are too close to call
+        self.synthesis_strategy = multi_model_config.get('synthesis_strategy', 'llm')
+        self.selection_margin = multi_model_config.get('selection_margin', 0.02)
+        
+        # Optional: skip synthesis when the two summaries are at least this similar
+        self.duplicate_similarity = multi_model_config.get('duplicate_similarity')
+        
+        # Optional hard cap on estimated spend per video - synthesis is skipped rather than exceed it
+        self.max_cost_per_video_usd = multi_model_config.get('max_cost_per_video_usd')
+        
+        # Optional near-duplicate summary cache in front of the whole pipeline
+        summary_cache_path = multi_model_config.get('summary_cache_path')
+        self.summary_cache = SummaryCache(
+            summary_cache_path,
+            similarity_threshold=multi_model_config.get('summary_cache_similarity', 0.95)
+        ) if summary_cache_path else None
+        
+        # Optional exact-match cache of individual model responses (None = disabled)
+        llm_cache_dir = multi_model_config.get('llm_cache_dir')
+        self.llm_cache = LLMCache(
+            FileBackend(llm_cache_dir),
+            ttl_seconds=multi_model_config.get('llm_cache_ttl_seconds', 86400)
+        ) if llm_cache_dir else None
+        
+        # Optional cap on transcript size sent to synthesis (None = full transcript)
+        self.synthesis_max_original_chars = multi_model_config.get('synthesis_max_original_chars')
+        
+        # Optional token budget for an extractive sketch of the transcript sent to
+        # synthesis instead of the full text (None = disabled)
+        self.synthesis_sketch_tokens = multi_model_config.get('synthesis_sketch_tokens')
+        
+        # Optional wall-clock budget for one video's pipeline; each call gets the
+        # remaining budget as its timeout (None = per-call client timeout only)
+        self.max_pipeline_seconds = multi_model_config.get('max_pipeline_seconds')
+        
+        # Open the provider connection (TCP + TLS) in the background at startup
+        self.warmup_connection = multi_model_config.get('warmup_connection', True)
+        
+        # Stream synthesis tokens to a caller-supplied callback while they arrive
+        self.stream_synthesis = multi_model_config.get('stream_synthesis', False)
+        
         # Get synthesis prompt template
         synthesis_template_path = multi_model_config.get('synthesis_prompt_template_path')
         if synthesis_template_path:
             try:
-                with open(synthesis_template_path, 'r', encoding='utf-8') as f:
-                    self.synthesis_template = f.read()
+                self.synthesis_template = load_template(synthesis_template_path)
             except FileNotFoundError:
                 raise ValueError(f"Synthesis template file not found: {synthesis_template_path}")
         else:
+            # Fixed instructions first, then the transcript, then the summaries: the
+            # longest identical prefix forms a cacheable prompt (provider-side prompt caching)
             self.synthesis_template = """
 You are synthesizing two AI-generated summaries to create the best possible final summary.
+Create a comprehensive final summary that combines the best insights from both summaries while maintaining accuracy and the creator's voice.
+
+**ORIGINAL CONTENT:**
+{original_content}
 
 **SUMMARY A:**
 {summary_a}
 
 **SUMMARY B:**
 {summary_b}
-
-**ORIGINAL CONTENT:**
-{original_content}
-
-Create a comprehensive final summary that combines the best insights from both summaries while maintaining accuracy and the creator's voice.
 """
+        
+        self._synthesis_segments = _compile_template(self.synthesis_template)
 
     def _init_clients(self):
-        """Initialize OpenAI clients"""
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        """Initialize OpenAI clients, reusing a shared client for the same provider"""
+        client, created = get_shared_client(self.api_key, self.base_url)
+        self.client = client
+        
+        # Only a brand-new client has a cold pool; warm it while videos are being fetched
+        if created and self.warmup_connection:
+            threading.Thread(target=_warm_up_client, args=(client,), daemon=True).start()
+        
+        # Ask OpenRouter to include the charged cost in every response's usage block.
+        # Other providers reject unknown request fields, so only send it there.
+        self._extra_body = {'usage': {'include': True}} if 'openrouter.ai' in self.base_url else None
+
+    def _supports_cache_control(self, model: str) -> bool:
+        """Whether explicit cache_control markers can be sent for this model.
+        
+        OpenAI-style providers cache prompt prefixes automatically; Anthropic
+        models (reached through OpenRouter) need the prefix marked explicitly.
+        """
+        return self._extra_body is not None and model.startswith('anthropic/')
 
-    def _get_creator_context(self) -> str:
+    def _call_model(self, model: str, create: Callable, deadline: Optional[float] = None, **kwargs):
+        """Call a chat completions endpoint through the model's circuit breaker.
+        
+        While a model's circuit is open the call is refused immediately with
+        CircuitOpenError (which llm_retry does not retry), so the pipeline drops
+        straight to its fallback branch instead of waiting out timeouts and backoff.
+        With a pipeline deadline (time.monotonic() value) the call's timeout is the
+        remaining budget, and DeadlineExceededError is raised when too little is left.
+        """
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining < _MIN_CALL_SECONDS:
+                raise DeadlineExceededError(f"Pipeline time budget exhausted, skipping {model}")
+            kwargs['timeout'] = remaining
+        
+        breaker = get_circuit_breaker(model)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {model}, skipping call")
+        try:
+            response = create(model=model, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return response
+
+    def _complete(self, model: str, messages: list, temperature: float, prompt: str,
+                  deadline: Optional[float] = None) -> Tuple[str, dict]:
+        """Run a non-streaming completion through the optional response cache.
+        
+        Returns the stripped response text and usage (estimated from prompt when
+        the provider reports none). Cache hits carry their original token counts
+        plus cache_hit=True, which the cost estimate treats as free.
+        """
+        cache_key = None
+        if self.llm_cache:
+            cache_key = self.llm_cache.cache_key(model, messages, temperature)
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit", model=model)
+                return cached['text'], dict(cached['usage'], cache_hit=True)
+        
+        response = self._create_completion_json(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            extra_body=self._extra_body,
+            deadline=deadline
+        )
+        text = _message_text(response)
+        usage_info = _extract_usage_json(response) or self._estimate_usage(prompt, text)
+        
+        # Never cache empty responses - those are failures worth retrying
+        if cache_key and text:
+            self.llm_cache.set(cache_key, {'text': text, 'usage': usage_info})
+        return text, usage_info
+
+    def _create_completion(self, model: str, **kwargs):
+        """Create a completion parsed by the SDK (needed for streaming)"""
+        return self._call_model(model, self.client.chat.completions.create, **kwargs)
+
+    def _create_completion_json(self, model: str, **kwargs) -> dict:
+        """Create a completion and decode its JSON body directly.
+        
+        Only the message text and usage counters are needed, so building the
+        SDK's pydantic response objects is skipped. The SDK still handles auth,
+        the shared connection pool, and raising on HTTP error statuses.
+        """
+        raw_response = self._call_model(model, self.client.chat.completions.with_raw_response.create, **kwargs)
+        return loads(raw_response.content)
+
+    def _resolve_creator_context(self) -> str:
         """Get creator context from configuration or use generic default.
         
         Retrieves creator context from channel configuration to maintain
@@ -215,66 +601,233 @@ Create a comprehensive final summary that combines the best insights from both s
         # Ultimate fallback for completely generic processing
         return "Generic content creator with engaging, informative style"
 
-    def _calculate_cost_estimate(self, usage_data: dict) -> float:
-        """Calculate estimated cost based on token usage and model pricing"""
-        # Basic cost estimation - these are rough estimates and should be updated with actual pricing
-        model_costs = {
-            # OpenAI models (per 1K tokens)
-            'gpt-4o': {'input': 0.0025, 'output': 0.01},
-            'gpt-4o-mini': {'input': 0.00015, 'output': 0.0006},
-            'gpt-4': {'input': 0.03, 'output': 0.06},
-            'gpt-3.5-turbo': {'input': 0.0015, 'output': 0.002},
-            
-            # Anthropic models (per 1K tokens)
-            'anthropic/claude-3-opus': {'input': 0.015, 'output': 0.075},
-            'anthropic/claude-3-sonnet': {'input': 0.003, 'output': 0.015},
-            'anthropic/claude-3-haiku': {'input': 0.00025, 'output': 0.00125},
-            
-            # Default fallback pricing
-            'default': {'input': 0.001, 'output': 0.002}
+    def _is_trivial_content(self, content: str) -> bool:
+        """Check whether content is too short or repetitive to be worth summarizing"""
+        stripped = content.strip() if content else ''
+        if len(stripped) < self.min_content_chars:
+            return True
+        return len(set(stripped.split())) < self.min_distinct_words
+
+    def _content_too_short_result(self, content: str) -> Optional[dict]:
+        """Result for content not worth summarizing (no model is called), else None"""
+        # @security:cost-control - prevents paying for summaries of near-empty content
+        if not self._is_trivial_content(content):
+            return None
+        logger.warning("Content too short to summarize, skipping all model calls",
+                     content_length=len(content) if content else 0,
+                     min_content_chars=self.min_content_chars)
+        result = self._new_result()
+        result['final_summary'] = "Content too short to summarize"
+        result['summarization_method'] = 'content_too_short'
+        return result
+
+    def _estimate_usage(self, prompt: str, completion: str) -> dict:
+        """Estimate token usage locally when the provider does not report it"""
+        prompt_tokens = _count_tokens(prompt)
+        completion_tokens = _count_tokens(completion)
+        return {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+            'estimated': True
         }
+
+    def _count_prompt_overhead(self, synthesis_segments: Tuple[Tuple[str, Optional[str]], ...]) -> int:
+        """Tokens of system and template text sent around the transcript by a full pipeline run"""
+        summary_literals = ''.join(literal for literal, _ in self._prompt_segments)
+        synthesis_literals = ''.join(literal for literal, _ in synthesis_segments)
+        summary_overhead = _token_length(_SYSTEM_PROMPT_SUMMARY) + _token_length(summary_literals)
+        synthesis_overhead = _token_length(_SYSTEM_PROMPT_SYNTHESIS) + _token_length(synthesis_literals)
+        return 2 * summary_overhead + synthesis_overhead
+
+    def _estimate_pipeline_tokens(self, content: str) -> int:
+        """Estimate input tokens the full pipeline would send for this content.
+        
+        Primary and secondary each read the whole transcript; synthesis reads it
+        again (capped by synthesis_max_original_chars). Counted with tiktoken when
+        available, which is far closer than a character heuristic for non-English text.
+        The fixed system and template text of all three calls is included; the two
+        summaries synthesis also reads are unknown up front and are not.
+        """
+        return 2 * _count_tokens(content) + self._synthesis_original_tokens(content) + self._prompt_overhead_tokens
+
+    def _synthesis_original_tokens(self, content: str) -> int:
+        """Tokens of transcript text synthesis will read (sketch budget or character cap applied)"""
+        content_tokens = _count_tokens(content)
+        if self.synthesis_sketch_tokens:
+            return min(content_tokens, self.synthesis_sketch_tokens)
+        if self.synthesis_max_original_chars and len(content) > self.synthesis_max_original_chars:
+            return _count_tokens(content[:self.synthesis_max_original_chars])
+        return content_tokens
+
+    def _synthesis_over_budget(self, content: str, primary_summary: str, secondary_summary: str,
+                               usage_data: dict) -> bool:
+        """Whether spend so far plus an estimated synthesis call would exceed max_cost_per_video_usd.
+        
+        Synthesis reads both summaries and the transcript; its output is assumed
+        to be about as long as the longer summary.
+        """
+        spent = self._calculate_cost_estimate(usage_data)
+        _, input_rate, output_rate = self._pricing_by_role['synthesis']
+        summary_tokens = (_token_length(primary_summary), _token_length(secondary_summary))
+        input_tokens = self._synthesis_original_tokens(content) + sum(summary_tokens)
+        synthesis_estimate = input_tokens * input_rate + max(summary_tokens) * output_rate
+        if spent + synthesis_estimate <= self.max_cost_per_video_usd:
+            return False
+        logger.warning("Synthesis would exceed per-video budget, keeping best summary",
+                     spent=round(spent, 6),
+                     synthesis_estimate=round(synthesis_estimate, 6),
+                     max_cost_per_video_usd=self.max_cost_per_video_usd)
+        return True
+
+    def _synthesis_original(self, content: str, summary_a: str, summary_b: str) -> str:
+        """Transcript text synthesis checks the summaries against (sketched or capped if configured)"""
+        if self.synthesis_sketch_tokens:
+            return self._sketch_original(content, summary_a, summary_b)
+        if self.synthesis_max_original_chars and len(content) > self.synthesis_max_original_chars:
+            return content[:self.synthesis_max_original_chars]
+        return content
+
+    def _sketch_original(self, content: str, summary_a: str, summary_b: str) -> str:
+        """Shrink the transcript to the passages most relevant to both summaries.
+        
+        Passages are scored by term-vector cosine similarity against the two
+        summaries combined, then the best ones are kept up to the
+        synthesis_sketch_tokens budget and re-emitted in their original order.
+        Synthesis still sees verbatim source text to check both summaries
+        against, at a fraction of the input tokens.
+        """
+        budget = self.synthesis_sketch_tokens
+        passages = split_passages(content)
+        lengths = [_token_length(passage) for passage in passages]
+        if sum(lengths) <= budget:
+            return content
+        
+        scores = similarity_scores(passages, summary_a + ' ' + summary_b)
+        
+        kept = []
+        used_tokens = 0
+        for index in sorted(range(len(passages)), key=scores.__getitem__, reverse=True):
+            if used_tokens + lengths[index] <= budget:
+                kept.append(index)
+                used_tokens += lengths[index]
+        
+        logger.info("Sketched transcript for synthesis",
+                   passages_total=len(passages),
+                   passages_kept=len(kept),
+                   sketch_tokens=used_tokens)
+        return ' '.join(passages[index] for index in sorted(kept))
+
+    def _select_summary(self, content: str, primary_summary: str, secondary_summary: str) -> Optional[str]:
+        """Pick the summary closer to the transcript, or None when too close to call.
+        
+        Scores each summary by cosine similarity of its term vector against the
+        transcript. A clear winner makes the synthesis call unnecessary; scores
+        within selection_margin mean the summaries genuinely differ and are
+        worth synthesizing.
+        
+        Returns:
+            Optional[str]: 'primary', 'secondary', or None if synthesis is needed
+        """
+        content_vector = term_vector(content)
+        primary_score = cosine_similarity(term_vector(primary_summary), content_vector)
+        secondary_score = cosine_similarity(term_vector(secondary_summary), content_vector)
+        
+        logger.info("Scored summaries against transcript",
+                   primary_score=round(primary_score, 4),
+                   secondary_score=round(secondary_score, 4),
+                   selection_margin=self.selection_margin)
         
+        if abs(primary_score - secondary_score) < self.selection_margin:
+            return None
+        return 'primary' if primary_score > secondary_score else 'secondary'
+
+    def _summaries_agree(self, primary_summary: str, secondary_summary: str) -> bool:
+        """Whether the two summaries are similar enough that synthesis would add nothing"""
+        similarity = cosine_similarity(term_vector(primary_summary), term_vector(secondary_summary))
+        logger.info("Compared summaries", similarity=round(similarity, 4),
+                   duplicate_similarity=self.duplicate_similarity)
+        return similarity >= self.duplicate_similarity
+
+    @staticmethod
+    def _longer_summary(primary_summary: str, primary_usage: dict,
+                        secondary_summary: str, secondary_usage: dict) -> str:
+        """'primary' or 'secondary', whichever summary is longer (ties go to primary).
+        
+        Compares completion tokens when both calls reported them - the models'
+        own length measure, consistent across languages - else characters.
+        """
+        primary_tokens = primary_usage.get('completion_tokens') if primary_usage else None
+        secondary_tokens = secondary_usage.get('completion_tokens') if secondary_usage else None
+        if primary_tokens is None or secondary_tokens is None:
+            primary_tokens, secondary_tokens = len(primary_summary), len(secondary_summary)
+        return 'primary' if primary_tokens >= secondary_tokens else 'secondary'
+
+    def _record_usage(self, result: dict, usage_data: dict):
+        """Store the total cost and serialized token usage of usage_data on result"""
+        result['cost_estimate'] = self._calculate_cost_estimate(usage_data)
+        result['token_usage_json'] = dumps(usage_data) if usage_data else '{}'
+
+    def _calculate_cost_estimate(self, usage_data: dict) -> float:
+        """Calculate cost from provider-reported costs, else token usage and model pricing"""
         total_cost = 0.0
+        # Checked once - the per-model debug lines are off in production
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for model_type, usage_info in usage_data.items():
-            if not usage_info or 'total_tokens' not in usage_info:
+            total_tokens = usage_info.get('total_tokens') if usage_info else None
+            if total_tokens is None:
+                continue
+            
+            model_name, input_rate, output_rate = self._pricing_by_role.get(
+                model_type, ("default",) + _DEFAULT_PRICING)
+            
+            # Served from the response cache - nothing was billed for this call
+            if usage_info.get('cache_hit'):
+                if debug:
+                    logger.debug("Cost calculation", model=model_name, model_cost=0.0, source="cache")
+                continue
+            
+            # Provider-reported cost is authoritative - skip the pricing table
+            reported_cost = usage_info.get('cost')
+            if reported_cost is not None:
+                total_cost += reported_cost
+                if debug:
+                    logger.debug("Cost calculation", model=model_name, model_cost=reported_cost, source="provider")
                 continue
-                
-            model_name = getattr(self, f"{model_type}_model", "default")
-            pricing = model_costs.get(model_name, model_costs['default'])
             
             # Use prompt/completion tokens if available, otherwise estimate 70/30 split
-            if 'prompt_tokens' in usage_info and 'completion_tokens' in usage_info:
-                input_tokens = usage_info['prompt_tokens']
-                output_tokens = usage_info['completion_tokens']
-            else:
-                total_tokens = usage_info['total_tokens']
+            input_tokens = usage_info.get('prompt_tokens')
+            output_tokens = usage_info.get('completion_tokens')
+            if input_tokens is None or output_tokens is None:
                 input_tokens = int(total_tokens * 0.7)  # Estimate 70% input
                 output_tokens = int(total_tokens * 0.3)  # Estimate 30% output
             
-            # Calculate cost (pricing is per 1K tokens)
-            input_cost = (input_tokens / 1000) * pricing['input']
-            output_cost = (output_tokens / 1000) * pricing['output']
-            model_cost = input_cost + output_cost
+            model_cost = input_tokens * input_rate + output_tokens * output_rate
+            if usage_info.get('batch'):
+                model_cost *= _BATCH_PRICE_FACTOR
             
             total_cost += model_cost
             
-            logger.debug("Cost calculation", 
-                        model=model_name,
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        model_cost=round(model_cost, 6))
+            if debug:
+                logger.debug("Cost calculation", 
+                            model=model_name,
+                            input_tokens=input_tokens,
+                            output_tokens=output_tokens,
+                            model_cost=round(model_cost, 6))
         
         return round(total_cost, 6)
 
     # @agent:complexity high
     # @agent:side-effects external_api_call,token_consumption,cost_generation
-    # @agent:retry-policy api_retry_decorator,exponential_backoff
+    # @agent:retry-policy sdk_request_retries,llm_retry_decorator
     # @agent:performance O(n) where n=content_length, bottleneck=API_call_latency
     # @agent:security input_sanitization,content_truncation
     # @agent:test-coverage critical,integration,edge-cases
-    @api_retry
-    def _generate_single_summary(self, content: str, model: str, summary_type: str = "summary") -> tuple[str, dict]:
+    @llm_retry
+    def _generate_single_summary(self, content: str, model: str, summary_type: str = "summary",
+                                 deadline: Optional[float] = None,
+                                 prompt: Optional[str] = None) -> tuple[str, dict]:
         """Generate a single AI summary with comprehensive error handling and monitoring.
         
         Core summarization method that handles content validation, truncation,
@@ -303,6 +856,8 @@ Create a comprehensive final summary that combines the best insights from both s
             content (str): Raw video content to summarize. Must be non-empty.
             model (str): LLM model identifier (e.g., 'gpt-4o-mini', 'claude-3-haiku')
             summary_type (str): Type identifier for logging ('primary', 'secondary', 'synthesis')
+            deadline (float, optional): time.monotonic() by which the pipeline must finish
+            prompt (str, optional): Already-rendered user prompt for content; rendered here if omitted
             
         Returns:
             tuple[str, dict]: Summary text and usage metadata dictionary
@@ -310,8 +865,8 @@ Create a comprehensive final summary that combines the best insights from both s
                 - dict: Token usage info with prompt_tokens, completion_tokens, total_tokens
                 
         Raises:
-            OpenAI API exceptions: Handled by @api_retry decorator
-            Network exceptions: Handled by @api_retry decorator
+            OpenAI API exceptions: Transient statuses retried by the SDK, then raised
+            Network exceptions: Retried by the SDK, then by the @llm_retry decorator
             
         Performance:
             - Content validation: O(1)
@@ -332,100 +887,138 @@ Create a comprehensive final summary that combines the best insights from both s
             return "No content to summarize", {}
 
         # No content truncation - process full content regardless of length
-        logger.info("Processing full content without truncation", 
-                   content_length=len(content), 
-                   model=model)
-
-        prompt = self.prompt_template.format(content=content)
-        logger.info("Generating summary", 
-                   content_length=len(content), 
-                   model=model, 
-                   summary_type=summary_type)
+        if prompt is None:
+            prompt = self._render_prompt(content=content)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generating summary", 
+                       content_length=len(content), 
+                       model=model, 
+                       summary_type=summary_type,
+                       truncated=False)
 
-        response = self.client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are an expert content analyst who creates comprehensive, detailed summaries while preserving the original author's voice and style."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7
-        )
-        
-        summary = response.choices[0].message.content.strip()
-        
-        # Extract usage information
-        usage_info = {}
-        if hasattr(response, 'usage') and response.usage:
-            usage_info = {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+        messages = [
+            _SYSTEM_MESSAGE_SUMMARY,
+            {"role": "user", "content": prompt}
+        ]
+        summary, usage_info = self._complete(model, messages, 0.7, prompt, deadline)
+        summary_length = len(summary)
         
-        logger.info("Generated summary", 
-                   summary_length=len(summary), 
-                   model=model,
-                   summary_type=summary_type,
-                   usage_info=usage_info,
-                   preview=summary[:200])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generated summary", 
+                       summary_length=summary_length, 
+                       model=model,
+                       summary_type=summary_type,
+                       usage_info=usage_info,
+                       preview=summary[:200])
         
-        if not summary:
+        if not summary_length:
             logger.warning("LLM returned empty summary", model=model, summary_type=summary_type)
-            return f"Summary generation failed - empty response from {model}", usage_info
+            return f"{_FAILED_SUMMARY_PREFIX} - empty response from {model}", usage_info
         
         # Additional validation: check for very short responses that might indicate failure
-        if len(summary.strip()) < 50:
+        # Still return it, but log the concern - let the caller decide
+        if summary_length < _MIN_SUMMARY_CHARS and logger.isEnabledFor(logging.WARNING):
             logger.warning("LLM returned suspiciously short summary", 
                          model=model, 
                          summary_type=summary_type,
-                         summary_length=len(summary),
+                         summary_length=summary_length,
                          summary_preview=summary[:100])
-            # Still return it, but log the concern - let the caller decide
         
         return summary, usage_info
 
-    @api_retry
-    def _synthesize_summaries(self, summary_a: str, summary_b: str, original_content: str) -> tuple[str, dict]:
+    def _build_synthesis_messages(self, summary_a: str, summary_b: str, original_content: str) -> Tuple[list, str]:
+        """Build the synthesis chat messages and the flat prompt text used for usage estimates"""
+        # Prepare synthesis prompt as stable prefix + per-call suffix
+        # Model names and creator context were bound into the template at init
+        # original_content is already sketched or capped by _synthesis_original if configured
+        prompt_prefix = self._render_synthesis_prefix(
+            summary_a=summary_a, summary_b=summary_b, original_content=original_content)
+        prompt_suffix = self._render_synthesis_suffix(
+            summary_a=summary_a, summary_b=summary_b, original_content=original_content)
+        synthesis_prompt = prompt_prefix + prompt_suffix
+        
+        user_content = synthesis_prompt
+        if self._supports_cache_control(self.synthesis_model) and prompt_suffix:
+            # Anthropic via OpenRouter only caches prefixes that are explicitly marked
+            user_content = [
+                {"type": "text", "text": prompt_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt_suffix}
+            ]
+        
+        messages = [
+            _SYSTEM_MESSAGE_SYNTHESIS,
+            {"role": "user", "content": user_content}
+        ]
+        return messages, synthesis_prompt
+
+    @llm_retry
+    def _synthesize_summaries(self, summary_a: str, summary_b: str, original_content: str,
+                              deadline: Optional[float] = None) -> tuple[str, dict]:
         """Synthesize two summaries into a final enhanced summary"""
         logger.info("Synthesizing summaries", 
                    summary_a_length=len(summary_a),
                    summary_b_length=len(summary_b),
                    model=self.synthesis_model)
 
-        # Prepare synthesis prompt
-        synthesis_prompt = self.synthesis_template.format(
-            summary_a=summary_a,
-            summary_b=summary_b,
-            original_content=original_content,  # Full original content for synthesis
-            model_a=self.primary_model,
-            model_b=self.secondary_model,
-            creator_context=self._get_creator_context()
-        )
+        messages, synthesis_prompt = self._build_synthesis_messages(summary_a, summary_b, original_content)
 
-        response = self.client.chat.completions.create(
+        # Lower temperature for more consistent synthesis
+        synthesis, usage_info = self._complete(self.synthesis_model, messages, 0.5, synthesis_prompt, deadline)
+        
+        logger.info("Generated synthesis", 
+                   synthesis_length=len(synthesis),
+                   model=self.synthesis_model,
+                   usage_info=usage_info,
+                   preview=synthesis[:200])
+        
+        return synthesis, usage_info
+
+    @llm_retry
+    def _synthesize_summaries_stream(self, summary_a: str, summary_b: str, original_content: str,
+                                     on_update: Callable[[str], None],
+                                     deadline: Optional[float] = None) -> tuple[str, dict]:
+        """Synthesize two summaries, publishing the partial text as tokens stream in.
+        
+        on_update receives the full text accumulated so far (not just the new
+        delta), so a retry after a dropped stream simply restarts the preview
+        instead of duplicating text. Returns the same (synthesis, usage) tuple
+        as _synthesize_summaries.
+        """
+        logger.info("Synthesizing summaries (streaming)", 
+                   summary_a_length=len(summary_a),
+                   summary_b_length=len(summary_b),
+                   model=self.synthesis_model)
+
+        messages, synthesis_prompt = self._build_synthesis_messages(summary_a, summary_b, original_content)
+
+        stream = self._create_completion(
             model=self.synthesis_model,
-            messages=[
-                {"role": "system", "content": "You are an expert synthesis specialist who combines multiple AI summaries into the highest quality final summary possible."},
-                {"role": "user", "content": synthesis_prompt}
-            ],
-            temperature=0.5   # Lower temperature for more consistent synthesis
+            messages=messages,
+            temperature=0.5,
+            stream=True,
+            stream_options={"include_usage": True},  # Final chunk carries the usage block
+            extra_body=self._extra_body,
+            deadline=deadline
         )
         
-        synthesis = response.choices[0].message.content.strip()
-        
-        # Extract usage information
+        parts = []
         usage_info = {}
-        if hasattr(response, 'usage') and response.usage:
-            usage_info = {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    on_update(''.join(parts))
+            usage_info = _extract_usage(chunk) or usage_info
+        
+        synthesis = ''.join(parts).strip()
+        usage_info = usage_info or self._estimate_usage(synthesis_prompt, synthesis)
         
         logger.info("Generated synthesis", 
                    synthesis_length=len(synthesis),
                    model=self.synthesis_model,
                    usage_info=usage_info,
+                   streamed=True,
                    preview=synthesis[:200])
         
         return synthesis, usage_info
@@ -438,10 +1031,10 @@ Create a comprehensive final summary that combines the best insights from both s
     # @agent:complexity critical
     # @agent:side-effects external_api_calls,cost_generation,database_ready_output
     # @agent:retry-policy handled_by_individual_methods
-    # @agent:performance O(3*n) where n=content_length, 3_sequential_API_calls
+    # @agent:performance O(3*n) where n=content_length, 2_concurrent_then_1_sequential_API_calls
     # @agent:security cost_threshold_enforcement,input_validation
     # @agent:test-coverage critical,integration,cost-scenarios,fallback-scenarios
-    def summarize_enhanced(self, content: str) -> dict:
+    def summarize_enhanced(self, content: str, on_synthesis_update: Optional[Callable[[str], None]] = None) -> dict:
         """Generate multi-model enhanced summary with comprehensive cost controls and fallback strategies.
         
         Main orchestration method that coordinates the complete multi-model pipeline:
@@ -459,27 +1052,37 @@ Create a comprehensive final summary that combines the best insights from both s
         
         AI-DECISION: Processing strategy selection
         Criteria:
-        - Estimated tokens ≤ threshold → full multi-model processing
-        - Estimated tokens > threshold → fallback strategy (primary_summary or best_summary)
+        - Content empty or trivially short → return immediately, no API calls (content_too_short)
+        - Summary cache enabled and near-duplicate transcript cached → return it (semantic_cache_hit)
+        - No cost_threshold_tokens configured or estimate ≤ threshold → full multi-model processing
+        - Estimated tokens > threshold → fallback_strategy: primary_summary runs the primary model
+          only, best_summary keeps the better summary without synthesis (cost_fallback_primary/secondary)
         - Primary model fails, secondary succeeds → use secondary as final (secondary_only)
         - Secondary model fails, primary succeeds → use primary as final (primary_only)
         - Both models succeed → proceed with synthesis (multi_model)
+        - Both succeed, synthesis_strategy='select', clear winner → use it (selected_primary/selected_secondary)
+        - Both succeed, summaries at least duplicate_similarity alike → keep the longer (synthesis_skipped_duplicate)
+        - Both succeed, synthesis would push spend past max_cost_per_video_usd → keep the longer
+          (budget_fallback_primary/budget_fallback_secondary)
         - Both models fail → try synthesis model as last resort (synthesis_fallback)
         - All models fail → return error message (complete_failure)
+        - max_pipeline_seconds spent → remaining calls skipped, same fallbacks as a model failure
         
         Decision Logic:
         1. Initialize result structure and start timing
         2. Estimate token usage and check against cost threshold
         3. If over threshold: execute fallback strategy and return
         4. If under threshold: execute full multi-model pipeline
-        5. Generate primary summary with usage tracking
-        6. Generate secondary summary with usage tracking  
+        5. Generate primary and secondary summaries concurrently with usage tracking
+        6. Collect both results, recording individual model failures
         7. Synthesize both summaries into final result
         8. Calculate total costs and processing time
         9. Return comprehensive result with all metadata
         
         Args:
             content (str): Raw video content to summarize. Must be non-empty string.
+            on_synthesis_update (Callable[[str], None], optional): Receives the partial
+                synthesis text as it streams in when stream_synthesis is enabled
             
         Returns:
             dict: Comprehensive result dictionary with all processing metadata:
@@ -497,11 +1100,10 @@ Create a comprehensive final summary that combines the best insights from both s
                 - cost_estimate (float): Estimated cost in USD
                 
         Performance:
-            - Cost estimation: O(1) - simple character count calculation
-            - Primary summarization: O(n) + API latency (10-30s typical)
-            - Secondary summarization: O(n) + API latency (10-30s typical)
+            - Cost estimation: O(n) tiktoken count, only when a threshold is configured
+            - Primary + secondary summarization: O(n) + max of both API latencies (10-30s typical)
             - Synthesis: O(summary_length) + API latency (5-15s typical)
-            - Total time: 25-75 seconds for full pipeline
+            - Total time: 15-45 seconds for full pipeline
             
         AI-NOTE: 
             - Cost threshold enforcement is critical - never bypass
@@ -511,9 +1113,111 @@ Create a comprehensive final summary that combines the best insights from both s
             - Processing time tracking helps identify bottlenecks
             - Comprehensive logging enables production debugging
         """
-        start_time = time.time()
+        # Checked before the cache lookup and token estimate - both cost more than this
+        too_short = self._content_too_short_result(content)
+        if too_short:
+            return too_short
+        
+        if self.summary_cache:
+            start_time = time.monotonic()
+            cached = self.summary_cache.lookup(content)
+            if cached:
+                # Served from cache - no tokens spent on this run
+                cached.update({
+                    'summarization_method': 'semantic_cache_hit',
+                    'processing_time_seconds': round(time.monotonic() - start_time, 2),
+                    'token_usage_json': '{}',
+                    'cost_estimate': 0.0
+                })
+                return cached
+        
+        # @security:cost-control - opt-in guard against very long transcripts
+        estimated_tokens = self._estimate_pipeline_tokens(content) if self.cost_threshold_tokens else 0
+        if self.cost_threshold_tokens and estimated_tokens > self.cost_threshold_tokens:
+            logger.warning("Estimated tokens exceed cost threshold, using fallback strategy",
+                         estimated_tokens=estimated_tokens,
+                         cost_threshold_tokens=self.cost_threshold_tokens,
+                         fallback_strategy=self.fallback_strategy)
+            result = self._run_cost_fallback(content)
+        else:
+            result = self._run_pipeline(content, self._generate_pair, on_synthesis_update)
+        
+        if self.summary_cache:
+            self.summary_cache.store(content, result)
+        return result
+
+    async def asummarize_enhanced(self, content: str,
+                                  on_synthesis_update: Optional[Callable[[str], None]] = None) -> dict:
+        """Awaitable summarize_enhanced for callers running an asyncio event loop.
+        
+        The pipeline runs in a worker thread (its primary/secondary calls already
+        overlap on the shared pair executor), so many videos can be awaited
+        together, e.g. with asyncio.gather, without blocking the loop. A separate
+        AsyncOpenAI code path would duplicate every fallback branch for no
+        latency gain over the concurrent sync calls.
+        """
+        return await asyncio.to_thread(self.summarize_enhanced, content, on_synthesis_update)
+
+    async def summarize_many(self, contents: List[str], max_concurrent: int = 10,
+                             tpm_limit: Optional[int] = None) -> List[dict]:
+        """Summarize many transcripts concurrently within concurrency and token-rate limits.
+        
+        At most max_concurrent pipelines run at once. With tpm_limit set, each
+        pipeline first waits for its estimated input tokens in a shared
+        tokens-per-minute bucket, so a backlog sweep paces itself instead of
+        tripping provider rate limits; individual calls still retry 429s in
+        the SDK, honouring Retry-After. Results are returned in input order, and a pipeline that
+        raises yields an error_fallback result instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = TokenRateLimiter(tpm_limit) if tpm_limit else None
+        
+        async def run(content: str) -> dict:
+            async with semaphore:
+                if limiter:
+                    await limiter.acquire(self._estimate_pipeline_tokens(content))
+                return await self.asummarize_enhanced(content)
+        
+        outcomes = await asyncio.gather(*(run(content) for content in contents), return_exceptions=True)
+        
+        results = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Summarization failed in batch", index=index, error=str(outcome))
+                outcome = self._new_result()
+                outcome['summarization_method'] = 'error_fallback'
+                outcome['fallback_used'] = True
+                outcome['final_summary'] = "Summary generation failed due to errors"
+            results.append(outcome)
+        return results
+
+    def _generate_pair(self, content: str, deadline: Optional[float] = None) -> Tuple[Callable[[], tuple], Callable[[], tuple]]:
+        """Generate primary and secondary summaries concurrently.
         
-        result = {
+        Both calls are submitted before either result is awaited, so latency is
+        max(primary, secondary) instead of the sum.
+        
+        Returns:
+            Tuple of zero-argument callables yielding (summary, usage) for the
+            primary and secondary model, re-raising that model's exception if any
+        """
+        # Both models get the identical prompt - render it once and share it
+        prompt = self._render_prompt(content=content)
+        executor = _get_pair_executor()
+        primary_future = executor.submit(self._generate_single_summary, content, self.primary_model, "primary", deadline, prompt)
+        secondary_future = executor.submit(self._generate_single_summary, content, self.secondary_model, "secondary", deadline, prompt)
+        # Collect only after both are submitted - result() blocks until that model finishes
+        return primary_future.result, secondary_future.result
+
+    def _pipeline_deadline(self) -> Optional[float]:
+        """Monotonic deadline for a pipeline starting now, or None without a budget"""
+        if not self.max_pipeline_seconds:
+            return None
+        return time.monotonic() + self.max_pipeline_seconds
+
+    def _new_result(self) -> dict:
+        """Build an empty result dict with every field the database layer expects"""
+        return {
             'final_summary': '',
             'summarization_method': 'multi_model',
             'primary_summary': '',
@@ -527,14 +1231,49 @@ Create a comprehensive final summary that combines the best insights from both s
             'token_usage_json': '{}',
             'cost_estimate': 0.0
         }
+
+    def _run_cost_fallback(self, content: str) -> dict:
+        """Summarize over-threshold content with the configured fallback_strategy.
+        
+        'primary_summary' makes a single primary-model call; 'best_summary' runs
+        primary and secondary but skips the synthesis call (which would re-send
+        the transcript a third time) and keeps the better of the two.
+        """
+        if self.fallback_strategy != 'primary_summary':
+            return self._run_pipeline(content, self._generate_pair, synthesize=False)
         
+        start_time = time.monotonic()
+        result = self._new_result()
+        result['summarization_method'] = 'cost_fallback_primary'
+        result['fallback_used'] = True
+        try:
+            summary, usage = self._generate_single_summary(
+                content, self.primary_model, "cost_fallback", self._pipeline_deadline())
+            result['final_summary'] = summary
+            result['primary_summary'] = summary
+            self._record_usage(result, {'primary': usage})
+        except Exception as e:
+            logger.error("Cost fallback summarization failed", model=self.primary_model, error=str(e))
+            result['final_summary'] = "Summary generation failed due to errors"
+        result['processing_time_seconds'] = round(time.monotonic() - start_time, 2)
+        return result
+
+    def _run_pipeline(self, content: str, generate_pair: Callable,
+                      on_synthesis_update: Optional[Callable[[str], None]] = None,
+                      synthesize: bool = True) -> dict:
+        """Run the multi-model pipeline with primary/secondary outcomes from generate_pair.
+        
+        Shared by realtime summarization (concurrent API calls) and Batch API
+        collection (pre-fetched results), so both paths get identical failure
+        handling, synthesis, and cost accounting. With synthesize=False the better
+        of two successful summaries is kept instead of calling the synthesis model.
+        """
+        start_time = time.monotonic()
+        deadline = self._pipeline_deadline()
+        result = self._new_result()
         usage_data = {}
         
         try:
-            # No cost threshold - always use full multi-model pipeline
-            logger.info("Processing with full multi-model pipeline (no cost limits)")
-            
-            # Generate primary summary
             logger.info("Starting multi-model summarization", 
                        primary_model=self.primary_model,
                        secondary_model=self.secondary_model,
@@ -547,17 +1286,19 @@ Create a comprehensive final summary that combines the best insights from both s
             # - Synthesis model fails → use best available summary (primary or secondary)
             # - All models fail → return error message
             
+            primary_outcome, secondary_outcome = generate_pair(content, deadline)
+            
             primary_summary = ""
             primary_usage = {}
             primary_failed = False
             
             try:
-                primary_summary, primary_usage = self._generate_single_summary(content, self.primary_model, "primary")
+                primary_summary, primary_usage = primary_outcome()
                 result['primary_summary'] = primary_summary
                 usage_data['primary'] = primary_usage
                 
                 # Check if primary model returned an error message
-                if primary_summary.startswith("Summary generation failed"):
+                if primary_summary.startswith(_FAILED_SUMMARY_PREFIX):
                     primary_failed = True
                     logger.warning("Primary model failed", model=self.primary_model, error=primary_summary)
                 
@@ -567,18 +1308,17 @@ Create a comprehensive final summary that combines the best insights from both s
                 primary_summary = f"Primary model failed: {str(e)}"
                 result['primary_summary'] = primary_summary
             
-            # Generate secondary summary
             secondary_summary = ""
             secondary_usage = {}
             secondary_failed = False
             
             try:
-                secondary_summary, secondary_usage = self._generate_single_summary(content, self.secondary_model, "secondary")
+                secondary_summary, secondary_usage = secondary_outcome()
                 result['secondary_summary'] = secondary_summary
                 usage_data['secondary'] = secondary_usage
                 
                 # Check if secondary model returned an error message
-                if secondary_summary.startswith("Summary generation failed"):
+                if secondary_summary.startswith(_FAILED_SUMMARY_PREFIX):
                     secondary_failed = True
                     logger.warning("Secondary model failed, continuing with primary only", 
                                  model=self.secondary_model, error=secondary_summary)
@@ -595,7 +1335,7 @@ Create a comprehensive final summary that combines the best insights from both s
                 # Both models failed - try synthesis model as last resort
                 logger.error("Both primary and secondary models failed, trying synthesis model as fallback")
                 try:
-                    fallback_summary, fallback_usage = self._generate_single_summary(content, self.synthesis_model, "synthesis_fallback")
+                    fallback_summary, fallback_usage = self._generate_single_summary(content, self.synthesis_model, "synthesis_fallback", deadline)
                     result['final_summary'] = fallback_summary
                     result['synthesis_summary'] = fallback_summary
                     result['summarization_method'] = 'synthesis_fallback'
@@ -622,43 +1362,84 @@ Create a comprehensive final summary that combines the best insights from both s
                 result['fallback_used'] = True
                 
             else:
-                # Both models succeeded - proceed with synthesis
-                try:
-                    final_summary, synthesis_usage = self._synthesize_summaries(primary_summary, secondary_summary, content)
-                    result['synthesis_summary'] = final_summary
-                    result['final_summary'] = final_summary
-                    usage_data['synthesis'] = synthesis_usage
-                    result['summarization_method'] = 'multi_model'
+                # Both models succeeded - select directly if one clearly wins, else synthesize
+                selected = None
+                if self.synthesis_strategy == 'select' or not synthesize:
+                    selected = self._select_summary(content, primary_summary, secondary_summary)
+                
+                if not synthesize:
+                    # Over the cost threshold - never pay for synthesis; otherwise keep the longer summary
+                    selected = selected or self._longer_summary(primary_summary, primary_usage,
+                                                                secondary_summary, secondary_usage)
+                    logger.info("Cost limited, keeping best summary without synthesis", selected=selected)
+                    result['final_summary'] = primary_summary if selected == 'primary' else secondary_summary
+                    result['summarization_method'] = f'cost_fallback_{selected}'
+                    result['fallback_used'] = True
                     
-                except Exception as e:
-                    logger.warning("Synthesis failed, using best available summary", error=str(e))
-                    # Choose the better summary based on length (simple heuristic)
-                    if len(primary_summary) >= len(secondary_summary):
-                        result['final_summary'] = primary_summary
-                        result['summarization_method'] = 'synthesis_failed_primary'
-                    else:
-                        result['final_summary'] = secondary_summary
-                        result['summarization_method'] = 'synthesis_failed_secondary'
+                elif selected:
+                    logger.info("Selected summary without synthesis", selected=selected)
+                    result['final_summary'] = primary_summary if selected == 'primary' else secondary_summary
+                    result['summarization_method'] = f'selected_{selected}'
+                    
+                elif self.duplicate_similarity and self._summaries_agree(primary_summary, secondary_summary):
+                    # Synthesizing two near-identical summaries costs a call and adds nothing
+                    longer = self._longer_summary(primary_summary, primary_usage,
+                                                  secondary_summary, secondary_usage)
+                    logger.info("Summaries nearly identical, skipping synthesis", selected=longer)
+                    result['final_summary'] = primary_summary if longer == 'primary' else secondary_summary
+                    result['summarization_method'] = 'synthesis_skipped_duplicate'
+                    
+                elif self.max_cost_per_video_usd is not None and self._synthesis_over_budget(
+                        content, primary_summary, secondary_summary, usage_data):
+                    # @security:cost-control - per-video spend cap
+                    longer = self._longer_summary(primary_summary, primary_usage,
+                                                  secondary_summary, secondary_usage)
+                    result['final_summary'] = primary_summary if longer == 'primary' else secondary_summary
+                    result['summarization_method'] = f'budget_fallback_{longer}'
                     result['fallback_used'] = True
+                    
+                else:
+                    try:
+                        synthesis_content = self._synthesis_original(content, primary_summary, secondary_summary)
+                        if self.stream_synthesis and on_synthesis_update:
+                            final_summary, synthesis_usage = self._synthesize_summaries_stream(
+                                primary_summary, secondary_summary, synthesis_content, on_synthesis_update, deadline)
+                        else:
+                            final_summary, synthesis_usage = self._synthesize_summaries(
+                                primary_summary, secondary_summary, synthesis_content, deadline)
+                        result['synthesis_summary'] = final_summary
+                        result['final_summary'] = final_summary
+                        usage_data['synthesis'] = synthesis_usage
+                        result['summarization_method'] = 'multi_model'
+                    
+                    except Exception as e:
+                        logger.warning("Synthesis failed, using best available summary", error=str(e))
+                        # Choose the better summary based on length (simple heuristic)
+                        longer = self._longer_summary(primary_summary, primary_usage,
+                                                      secondary_summary, secondary_usage)
+                        result['final_summary'] = primary_summary if longer == 'primary' else secondary_summary
+                        result['summarization_method'] = f'synthesis_failed_{longer}'
+                        result['fallback_used'] = True
             
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             result['processing_time_seconds'] = round(processing_time, 2)
             
             # Calculate total cost and store usage data
-            result['cost_estimate'] = self._calculate_cost_estimate(usage_data)
-            result['token_usage_json'] = json.dumps(usage_data)
+            self._record_usage(result, usage_data)
             
             # Log completion with appropriate details based on what succeeded
-            final_summary = result['final_summary']
-            logger.info("Multi-model summarization completed",
-                       processing_time_seconds=result['processing_time_seconds'],
-                       summarization_method=result['summarization_method'],
-                       primary_length=len(result.get('primary_summary', '')),
-                       secondary_length=len(result.get('secondary_summary', '')),
-                       synthesis_length=len(result.get('synthesis_summary', '')),
-                       final_length=len(final_summary),
-                       fallback_used=result['fallback_used'],
-                       cost_estimate=result['cost_estimate'])
+            # primary_summary/secondary_summary are bound on every path above;
+            # _new_result guarantees the remaining keys exist
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Multi-model summarization completed",
+                           processing_time_seconds=result['processing_time_seconds'],
+                           summarization_method=result['summarization_method'],
+                           primary_length=len(primary_summary),
+                           secondary_length=len(secondary_summary),
+                           synthesis_length=len(result['synthesis_summary']),
+                           final_length=len(result['final_summary']),
+                           fallback_used=result['fallback_used'],
+                           cost_estimate=result['cost_estimate'])
             
             return result
             
@@ -671,18 +1452,146 @@ Create a comprehensive final summary that combines the best insights from both s
             result['fallback_used'] = True
             result['summarization_method'] = 'error_fallback'
             try:
-                fallback_summary, fallback_usage = self._generate_single_summary(content, self.primary_model, "error_fallback")
+                fallback_summary, fallback_usage = self._generate_single_summary(content, self.primary_model, "error_fallback", deadline)
                 result['final_summary'] = fallback_summary
                 result['primary_summary'] = fallback_summary
                 usage_data['primary'] = fallback_usage
-                result['cost_estimate'] = self._calculate_cost_estimate(usage_data)
-                result['token_usage_json'] = json.dumps(usage_data)
             except Exception as fallback_error:
                 logger.error("Fallback summarization also failed", error=str(fallback_error))
                 result['final_summary'] = "Summary generation failed due to errors"
-                result['cost_estimate'] = 0.0
-                result['token_usage_json'] = '{}'
+            # Calls completed before the failure were still billed
+            self._record_usage(result, usage_data)
             
-            result['processing_time_seconds'] = time.time() - start_time
+            result['processing_time_seconds'] = round(time.monotonic() - start_time, 2)
             
-            return result
\ No newline at end of file
+            return result
+
+    def _batch_request(self, custom_id: str, model: str, prompt: str) -> str:
+        """Build one JSONL line for the OpenAI Batch API"""
+        return dumps({
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': {
+                'model': model,
+                'messages': [_SYSTEM_MESSAGE_SUMMARY, {"role": "user", "content": prompt}],
+                'temperature': 0.7
+            }
+        })
+
+    # @agent:complexity medium
+    # @agent:side-effects external_api_call,file_upload,cost_generation
+    # @agent:performance 50% token cost of realtime calls, up to 24h turnaround
+    def submit_batch(self, contents: List[Tuple[str, str]]) -> str:
+        """Submit primary and secondary summaries for many videos as one Batch API job.
+        
+        Intended for latency-tolerant work such as channel backfills: the Batch
+        API bills at half the realtime price and has a separate rate-limit pool,
+        at the cost of up to 24h turnaround. Requires a provider implementing the
+        OpenAI Batch API (e.g. api.openai.com) - OpenRouter does not.
+        
+        Trivial transcripts are not uploaded; poll_batch() resolves them as
+        content_too_short without any model call, like summarize_enhanced.
+        
+        Args:
+            contents (List[Tuple[str, str]]): (video_id, content) pairs to summarize
+            
+        Returns:
+            str: Batch ID to pass to poll_batch()
+            
+        Raises:
+            ValueError: If every transcript is trivial and there is nothing to submit
+        """
+        lines = []
+        for video_id, content in contents:
+            if self._is_trivial_content(content):
+                continue
+            prompt = self._render_prompt(content=content)
+            lines.append(self._batch_request(f"{video_id}:primary", self.primary_model, prompt))
+            lines.append(self._batch_request(f"{video_id}:secondary", self.secondary_model, prompt))
+        if not lines:
+            raise ValueError("No content worth summarizing in batch")
+        
+        batch_file = self.client.files.create(
+            file=("summaries.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        logger.info("Submitted summarization batch", batch_id=batch.id, video_count=len(contents), request_count=len(lines))
+        return batch.id
+
+    def _parse_batch_output(self, output_text: str) -> Dict[str, tuple]:
+        """Parse Batch API output into {custom_id: (summary, usage) or error message}"""
+        outcomes = {}
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            record = loads(line)
+            response = record.get('response') or {}
+            body = response.get('body') or {}
+            if record.get('error') or response.get('status_code') != 200 or not body.get('choices'):
+                outcomes[record['custom_id']] = str(record.get('error') or body.get('error') or 'no response')
+                continue
+            
+            summary = _message_text(body)
+            usage_info = _extract_usage_json(body)
+            if usage_info:
+                usage_info['batch'] = True
+            outcomes[record['custom_id']] = (summary, usage_info)
+        return outcomes
+
+    def _batch_outcome(self, outcome, model: str) -> Callable[[], tuple]:
+        """Wrap a parsed batch outcome in the callable interface _run_pipeline expects"""
+        def resolve() -> tuple:
+            if outcome is None or isinstance(outcome, str):
+                raise LLMError(f"Batch request for {model} failed: {outcome or 'missing from output'}")
+            summary, usage_info = outcome
+            if not summary:
+                return f"{_FAILED_SUMMARY_PREFIX} - empty response from {model}", usage_info
+            return summary, usage_info
+        return resolve
+
+    def poll_batch(self, batch_id: str, contents: Dict[str, str]) -> Optional[Dict[str, dict]]:
+        """Collect a submitted batch and finish each video's pipeline.
+        
+        Primary/secondary results come from the batch; synthesis and all
+        failure handling then run exactly as in summarize_enhanced.
+        
+        Args:
+            batch_id (str): ID returned by submit_batch()
+            contents (Dict[str, str]): video_id → content, as submitted
+            
+        Returns:
+            Optional[Dict[str, dict]]: video_id → summarize_enhanced-style result,
+                or None while the batch is still running
+                
+        Raises:
+            LLMError: If the batch failed, expired, or was cancelled
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ('failed', 'expired', 'cancelled'):
+            raise LLMError(f"Batch {batch_id} ended with status: {batch.status}")
+        if batch.status != 'completed':
+            logger.info("Batch still in progress", batch_id=batch_id, status=batch.status)
+            return None
+        
+        outcomes = {}
+        if batch.output_file_id:
+            outcomes.update(self._parse_batch_output(self.client.files.content(batch.output_file_id).text))
+        if getattr(batch, 'error_file_id', None):
+            outcomes.update(self._parse_batch_output(self.client.files.content(batch.error_file_id).text))
+        
+        results = {}
+        for video_id, content in contents.items():
+            primary = self._batch_outcome(outcomes.get(f"{video_id}:primary"), self.primary_model)
+            secondary = self._batch_outcome(outcomes.get(f"{video_id}:secondary"), self.secondary_model)
+            results[video_id] = self._content_too_short_result(content) or self._run_pipeline(
+                content, lambda _content, _deadline, p=primary, s=secondary: (p, s))
+        
+        logger.info("Collected summarization batch", batch_id=batch_id, video_count=len(results))
+        return results
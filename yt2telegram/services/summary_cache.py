@@ -0,0 +1,127 @@
+import hashlib
+import sqlite3
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..utils.json_utils import dumps, loads
+from ..utils.logging_config import LoggerFactory
+from ..utils.text_similarity import term_vector, cosine_similarity
+
+logger = LoggerFactory.create_logger(__name__)
+
+# Summarization outcomes that must never be served from cache
+_UNCACHEABLE_METHODS = frozenset({'content_too_short', 'complete_failure', 'error_fallback'})
+
+# @agent:service-type data-access
+# @agent:scalability vertical
+# @agent:persistence database
+# @agent:priority optional
+# @agent:dependencies SQLite,FileSystem
+class SummaryCache:
+    """Near-duplicate summary cache in front of the multi-model pipeline.
+
+    Stores finished summarization results keyed by transcript. A lookup first
+    tries an exact content hash, then compares the transcript's term vector
+    against the most recent cached transcripts; a match at or above the
+    similarity threshold (re-uploads, mirrored channels, minor edits) returns
+    the cached result with zero LLM calls.
+
+    Architecture: Single SQLite file, shared across channels if configured so
+    Critical Path: Optional - any cache error falls through to normal processing
+    Failure Mode: Lookup/store errors are logged and treated as cache misses
+
+    Attributes:
+        db_path (Path): Cache database file path
+        similarity_threshold (float): Minimum cosine similarity for a near-duplicate hit
+        max_candidates (int): Number of most recent entries scanned for near-duplicates
+
+    Example:
+        >>> cache = SummaryCache("yt2telegram/downloads/summary_cache.db")
+        >>> cached = cache.lookup(transcript)
+        >>> if cached is None:
+        ...     cache.store(transcript, service.summarize_enhanced(transcript))
+    """
+
+    # Only the most frequent terms are stored - enough to identify a transcript
+    VECTOR_TERMS = 500
+
+    def __init__(self, db_path: str, similarity_threshold: float = 0.95, max_candidates: int = 500):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.similarity_threshold = similarity_threshold
+        self.max_candidates = max_candidates
+        self._create_table()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open a connection with the same settings as DatabaseService"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _create_table(self):
+        with self._get_connection() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    content_hash TEXT PRIMARY KEY,
+                    term_vector TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_summary_cache_created ON summary_cache(created_at)')
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _vector(self, content: str) -> Counter:
+        return Counter(dict(term_vector(content).most_common(self.VECTOR_TERMS)))
+
+    def lookup(self, content: str) -> Optional[dict]:
+        """Return a cached result for identical or near-duplicate content, else None"""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    'SELECT result_json FROM summary_cache WHERE content_hash = ?',
+                    (self._content_hash(content),)
+                ).fetchone()
+                if row:
+                    logger.info("Summary cache hit", match="exact")
+                    return loads(row[0])
+
+                rows = conn.execute(
+                    'SELECT term_vector, result_json FROM summary_cache ORDER BY created_at DESC LIMIT ?',
+                    (self.max_candidates,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Summary cache lookup failed", error=str(e))
+            return None
+
+        query = self._vector(content)
+        best_score, best_result = 0.0, None
+        for vector_json, result_json in rows:
+            score = cosine_similarity(query, Counter(loads(vector_json)))
+            if score > best_score:
+                best_score, best_result = score, result_json
+
+        if best_result is not None and best_score >= self.similarity_threshold:
+            logger.info("Summary cache hit", match="near_duplicate", similarity=round(best_score, 4))
+            return loads(best_result)
+        return None
+
+    def store(self, content: str, result: dict):
+        """Cache a finished summarization result (failures are never cached)"""
+        if result.get('summarization_method') in _UNCACHEABLE_METHODS:
+            return
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO summary_cache (content_hash, term_vector, result_json, created_at) VALUES (?, ?, ?, ?)',
+                    (self._content_hash(content), dumps(self._vector(content)),
+                     dumps(result), datetime.now().isoformat())
+                )
+        except sqlite3.Error as e:
+            logger.warning("Summary cache store failed", error=str(e))
@@ -1,15 +1,207 @@
+import asyncio
+import logging
 import os
+import random
+import socket
 import time
-from typing import List, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 import requests
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
-from ..utils.validators import Sanitizer
-from ..utils.retry import network_retry, retry
+from ..exceptions import TelegramAPIError, TelegramParseError, TelegramPermanentError
+from ..utils.json_utils import dumps_bytes, loads
+from ..utils.rate_limiter import ChatRateLimiter
+from ..utils.validators import InputValidator, Sanitizer, ValidationError
 from ..utils.logging_config import LoggerFactory
 
 logger = LoggerFactory.create_logger(__name__)
 
+# One HTTP session for every TelegramService instance: all sends go to the same
+# host, so keep-alive lets multi-part notifications skip the TCP/TLS handshake
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Pooled connections per host - enough for several bots sending at once
+_POOL_MAXSIZE = 10
+
+# TCP keepalive for pooled connections: channels are processed minutes apart, and
+# NATs/firewalls silently drop idle connections, which would leave the next send
+# hanging until the read timeout instead of reconnecting
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux; elsewhere the system's probe timing applies
+    _SOCKET_OPTIONS += [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+                        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)]
+
+# (connect, read) seconds: an unreachable API fails fast, a slow reply still gets time
+_REQUEST_TIMEOUT = (5, 30)
+
+# Worker pool for sending one message to several bots at once (see _get_send_executor);
+# kept below _POOL_MAXSIZE so every worker can hold a pooled connection
+_SEND_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SEND_EXECUTOR_LOCK = threading.Lock()
+_SEND_EXECUTOR_WORKERS = 8
+
+# Single worker behind submit_video_notification: callers hand notifications off
+# and carry on, while notifications still go out one at a time in submission order
+_NOTIFY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_NOTIFY_EXECUTOR_LOCK = threading.Lock()
+
+# Telegram allows about one message per second per chat and 30 per second overall;
+# shared by every TelegramService so channels posting to the same chat pace together
+_SEND_LIMITER = ChatRateLimiter(per_chat=1, global_limit=30)
+
+# Validated bot dicts keyed by their bot configs: every channel sharing a bot
+# setup skips the env lookups, token/chat validation and URL building
+_RESOLVED_BOTS: Dict[Tuple, List[Dict]] = {}
+_RESOLVED_BOTS_LOCK = threading.Lock()
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Notification header/footer; a channel's telegram_format overrides either key.
+# "{channel_name}" in the header is replaced with the channel's display name.
+_DEFAULT_MESSAGE_FORMAT = {'header': " New Video from {channel_name}", 'footer': ""}
+
+# Telegram allows 4096 characters per message after parsing; stay a little under
+# (emoji count double) and keep room for the "Part i/N" labels multi-part sends add
+_MESSAGE_SOFT_LIMIT = 4000
+_PART_LABEL_ROOM = 40
+
+# Telegram statuses worth retrying: flood control and server-side errors
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Statuses that will repeat for every message through this bot: revoked token,
+# bot blocked or kicked from the chat, unknown token
+_PERMANENT_STATUS = frozenset({401, 403, 404})
+
+
+def _get_send_executor() -> ThreadPoolExecutor:
+    """Return the shared multi-bot send pool, creating it on first use"""
+    global _SEND_EXECUTOR
+    with _SEND_EXECUTOR_LOCK:
+        if _SEND_EXECUTOR is None:
+            _SEND_EXECUTOR = ThreadPoolExecutor(max_workers=_SEND_EXECUTOR_WORKERS, thread_name_prefix='telegram-send')
+        return _SEND_EXECUTOR
+
+
+def _get_notify_executor() -> ThreadPoolExecutor:
+    """Return the shared notification queue worker, creating it on first use"""
+    global _NOTIFY_EXECUTOR
+    with _NOTIFY_EXECUTOR_LOCK:
+        if _NOTIFY_EXECUTOR is None:
+            _NOTIFY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='telegram-notify')
+        return _NOTIFY_EXECUTOR
+
+
+def _error_details(response: requests.Response) -> Tuple[dict, str]:
+    """Telegram's error JSON (or {}) and a short description, decoding the body once"""
+    body = response.content
+    try:
+        error_json = loads(body)
+    except ValueError:
+        return {}, body[:200].decode('utf-8', 'replace')
+    if not isinstance(error_json, dict):
+        return {}, body[:200].decode('utf-8', 'replace')
+    return error_json, str(error_json.get('description', ''))
+
+
+def _retry_after(response: requests.Response, error_json: dict) -> Optional[float]:
+    """Seconds Telegram asked us to wait (Retry-After header or parameters.retry_after), if any"""
+    header = response.headers.get('Retry-After')
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(error_json['parameters']['retry_after'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _resolve_bots(bot_configs: List[Dict]) -> List[Dict]:
+    """Resolve bot configs to validated bot dicts, once per distinct config"""
+    # Config order is kept in the key: it decides which bot a chat tries first
+    cache_key = tuple((c.get('name'), c.get('token_env'), c.get('chat_id_env'), c.get('chat_id'))
+                      for c in bot_configs)
+    with _RESOLVED_BOTS_LOCK:
+        cached = _RESOLVED_BOTS.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    bots = []
+    for config in bot_configs:
+        bot_name = config.get('name', 'Unnamed Bot')
+        
+        # Get token from environment
+        token_env_var = config.get('token_env')
+        if not token_env_var:
+            logger.warning("Skipping bot: Missing 'token_env' in config", bot_name=bot_name)
+            continue
+            
+        token = os.getenv(token_env_var)
+        if not token:
+            logger.error("Token not found in environment", bot_name=bot_name, token_env_var=token_env_var)
+            continue
+        
+        # Get chat ID
+        chat_id_env = config.get('chat_id_env')
+        chat_id_direct = config.get('chat_id')
+        
+        chat_id = None
+        if chat_id_env:
+            chat_id = os.getenv(chat_id_env)
+        if not chat_id and chat_id_direct:
+            chat_id = str(chat_id_direct)
+        
+        if not chat_id:
+            logger.error("Chat ID not found", bot_name=bot_name)
+            continue
+        
+        # Malformed credentials fail on every send - reject them once here instead
+        try:
+            InputValidator.validate_telegram_bot_token(token)
+            InputValidator.validate_telegram_chat_target(chat_id)
+        except ValidationError as e:
+            logger.error("Skipping bot: invalid configuration", bot_name=bot_name, error=str(e))
+            continue
+        
+        # URL and chat ID never change - build them once rather than on every send
+        bots.append({
+            'name': bot_name,
+            'token': token,
+            'chat_id': chat_id,
+            'send_url': f"https://api.telegram.org/bot{token}/sendMessage",
+            'base_payload': {'chat_id': chat_id}
+        })
+    
+    with _RESOLVED_BOTS_LOCK:
+        return _RESOLVED_BOTS.setdefault(cache_key, bots)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections send TCP keepalive probes"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _get_session() -> requests.Session:
+    """Return the shared Telegram API session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            # max_retries=0: _send_to_bot owns retrying, so urllib3 must not retry underneath it
+            session.mount("https://", _KeepAliveAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE, max_retries=0))
+            _SESSION = session
+        return _SESSION
+
+
 # @agent:service-type integration
 # @agent:scalability horizontal
 # @agent:persistence none
@@ -36,6 +228,10 @@ class TelegramService:
     
     Attributes:
         bots (List[Dict]): Configured bot instances with tokens and chat IDs
+        retry_attempts (int): Send attempts per bot, including the first
+        retry_delay_seconds (float): Base delay for exponential backoff between attempts
+        max_delay_seconds (float): Cap on any single wait, including Telegram's retry_after
+        message_format (Dict[str, str]): Notification header/footer, defaults merged with channel overrides
         
     Example:
         >>> bot_configs = [{"name": "Main Bot", "token_env": "TELEGRAM_BOT_TOKEN", "chat_id_env": "TELEGRAM_CHAT_ID"}]
@@ -47,53 +243,116 @@ class TelegramService:
         redundancy. Automatic message splitting for content > 4096 characters.
     """
     
-    def __init__(self, bot_configs: List[Dict]):
-        self.bots = []
+    # Notification skeleton - fixed strings, built once at import
+    _SEPARATOR = "━" * 20
+    _INTRO_END = f"\n{_SEPARATOR}\n\n"
+    _OUTRO_START = f"\n\n{_SEPARATOR}"
+    _HEADER_HTML = "🎬 <b>{}</b>\n\n"
+    _HEADER_PLAIN = "🎬 {}\n\n"
+    
+    def __init__(self, bot_configs: List[Dict], retry_attempts: int = 3,
+                 retry_delay_seconds: float = 1.0, max_delay_seconds: float = 30.0,
+                 message_format: Optional[Dict[str, str]] = None):
+        self.message_format = {**_DEFAULT_MESSAGE_FORMAT, **(message_format or {})}
+        self.retry_attempts = retry_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
         
-        for config in bot_configs:
-            bot_name = config.get('name', 'Unnamed Bot')
-            
-            # Get token from environment
-            token_env_var = config.get('token_env')
-            if not token_env_var:
-                logger.warning("Skipping bot: Missing 'token_env' in config", bot_name=bot_name)
-                continue
-                
-            token = os.getenv(token_env_var)
-            if not token:
-                logger.error("Token not found in environment", bot_name=bot_name, token_env_var=token_env_var)
-                continue
-            
-            # Get chat ID
-            chat_id_env = config.get('chat_id_env')
-            chat_id_direct = config.get('chat_id')
-            
-            chat_id = None
-            if chat_id_env:
-                chat_id = os.getenv(chat_id_env)
-            if not chat_id and chat_id_direct:
-                chat_id = str(chat_id_direct)
-            
-            if not chat_id:
-                logger.error("Chat ID not found", bot_name=bot_name)
-                continue
+        # Copies, so disabling a bot (see _deliver) stays scoped to this instance
+        self.bots = [dict(bot) for bot in _resolve_bots(bot_configs)]
+        
+        # Bots sharing a chat would post the same message twice - group them so each
+        # chat gets one copy, with the other bots as failover (dict keeps config order)
+        chat_groups: Dict[str, List[Dict]] = {}
+        for bot in self.bots:
+            chat_groups.setdefault(bot['chat_id'], []).append(bot)
+        self._chat_groups = list(chat_groups.values())
+        
+        # Set once Telegram rejects our HTML: the rest of this channel's parts (one
+        # service per channel run) come from the same model output and would fail too
+        self._plain_text_only = False
+        
+        self._session = _get_session()
+        logger.info("Initialized Telegram bots", count=len(self.bots), chats=len(self._chat_groups))
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter, so bots retrying together spread out"""
+        return random.uniform(0, min(self.max_delay_seconds, self.retry_delay_seconds * (2 ** attempt)))
+
+    def _send_to_bot(self, bot: Dict, payload: Dict):
+        """POST a sendMessage payload for one bot, retrying transient failures.
+        
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        jittered exponential backoff; a 429 waits exactly as long as Telegram
+        asks, unless that exceeds max_delay_seconds. Markup Telegram can't
+        parse raises TelegramParseError; 401/403/404 (bad token, bot blocked,
+        unknown chat) raise TelegramPermanentError and other HTTP errors
+        TelegramAPIError, all without retrying.
+        """
+        url = bot['send_url']
+        # Serialized once for all attempts; compact UTF-8 rather than requests' \uXXXX-escaped json=
+        body = dumps_bytes({**bot['base_payload'], **payload})
+        
+        for attempt in range(self.retry_attempts):
+            last_attempt = attempt == self.retry_attempts - 1
+            _SEND_LIMITER.acquire(bot['chat_id'])
+            try:
+                # Not stream=True: the reply is under a few KB, and closing it unread would
+                # drop the connection instead of returning it to the keep-alive pool
+                response = self._session.post(url, data=body, headers=_JSON_HEADERS, timeout=_REQUEST_TIMEOUT)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                error, wait_seconds = e, None
+            else:
+                # Nearly every send succeeds first time - keep that path to this one check
+                if response.ok:
+                    return
+                error, wait_seconds = self._classify_error_response(response, last_attempt)
+                if wait_seconds is not None:
+                    # Telegram's retry_after covers the chat, not just this request - hold
+                    # other threads and services sending there too
+                    _SEND_LIMITER.pause(bot['chat_id'], wait_seconds)
             
-            self.bots.append({
-                'name': bot_name,
-                'token': token,
-                'chat_id': chat_id
-            })
+            if wait_seconds is None:
+                wait_seconds = self._backoff_delay(attempt)
+            if logger.isEnabledFor(logging.WARNING):
+                # Redacted here rather than up front - requests' connection errors embed the URL and token
+                logger.warning("Telegram send failed, retrying", bot_name=bot['name'], attempt=attempt + 1,
+                             total_attempts=self.retry_attempts, error=str(error).replace(bot['token'], '***'),
+                             retry_delay=round(wait_seconds, 2))
+            time.sleep(wait_seconds)
+
+    def _classify_error_response(self, response: requests.Response, last_attempt: bool) -> Tuple[str, Optional[float]]:
+        """Raise for a failed response that must not be retried, else return (error, wait seconds or None)"""
+        # Build errors from Telegram's description, never from requests'
+        # HTTPError text - that embeds the URL and with it the bot token
+        error_json, description = _error_details(response)
+        error = f"HTTP {response.status_code}: {description}"
+        if response.status_code == 400 and "can't parse entities" in description:
+            # Markup problem - retrying the same text can't help, the caller picks another format
+            raise TelegramParseError(description)
+        if response.status_code in _PERMANENT_STATUS:
+            raise TelegramPermanentError(error)
+        if response.status_code not in _RETRYABLE_STATUS or last_attempt:
+            raise TelegramAPIError(error)
         
-        logger.info("Initialized Telegram bots", count=len(self.bots))
+        wait_seconds = None
+        if response.status_code == 429:
+            wait_seconds = _retry_after(response, error_json)
+            if wait_seconds is not None and wait_seconds > self.max_delay_seconds:
+                # Waiting that long would stall the whole run - give up on this bot
+                raise TelegramAPIError(error)
+        return error, wait_seconds
 
     # @agent:complexity high
     # @agent:side-effects external_api_call,network_io,message_delivery
-    # @agent:retry-policy network_retry_decorator,exponential_backoff
+    # @agent:retry-policy per_bot_exponential_backoff_full_jitter,retry_after
     # @agent:performance O(n*m) where n=bots, m=message_parts_after_splitting
     # @agent:security token_protection,input_sanitization,rate_limiting
     # @agent:test-coverage critical,integration,message-splitting,multi-bot
-    @network_retry
-    def send_message(self, message: str, parse_mode: str = "HTML", disable_preview: bool = True):
+    def send_message(self, message: str, parse_mode: str = "HTML", disable_preview: bool = True,
+                     plain_fallback: Optional[str] = None):
         """Send message to all configured bots with intelligent splitting and retry logic.
         
         Delivers messages through all configured Telegram bots with automatic
@@ -107,8 +366,8 @@ class TelegramService:
         1. Validate message content and bot configuration
         2. Sanitize message content to prevent injection attacks
         3. Split message if exceeds Telegram character limits
-        4. Send through each configured bot independently
-        5. Handle individual bot failures without affecting others
+        4. Send once per target chat, through the first of its bots that succeeds
+        5. Handle individual chat failures without affecting others
         6. Return overall success status based on delivery results
         
         AI-DECISION: Message splitting strategy
@@ -116,63 +375,129 @@ class TelegramService:
         - Message ≤ 4096 chars → send as single message
         - Message > 4096 chars → split intelligently at sentence boundaries
         - Split preserves formatting → maintain HTML tags across parts
-        - Network failure → retry with exponential backoff
+        - Network failure, 429 or 5xx → retry that bot with jittered exponential backoff
         - Bot failure → continue with remaining bots
         
         Args:
             message (str): Content to send. HTML formatting supported.
             parse_mode (str): Telegram parse mode ('HTML', 'Markdown', 'MarkdownV2')
             disable_preview (bool): Disable link previews for cleaner messages
+            plain_fallback (Optional[str]): Plain-text version sent instead, per bot,
+                only if Telegram rejects the message's markup
             
         Returns:
-            bool: True if at least one bot successfully delivered message
+            bool: True if the message reached every configured chat
             
         Performance:
             - Message validation: O(1)
             - Content sanitization: O(n) where n=message_length
             - Message splitting: O(n) with sentence boundary detection
-            - API calls: O(bots * message_parts) with network latency
+            - API calls: O(message_parts) round trips - bots are sent to concurrently
             - Total time: 1-5 seconds typical, up to 30s with retries
             
         AI-NOTE: 
             - Message splitting algorithm preserves formatting and readability
-            - Each bot operates independently - partial failures are acceptable
-            - Rate limiting is handled by network_retry decorator
+            - Each chat is delivered independently - partial failures are acceptable
+            - Rate limiting is handled per bot in _send_to_bot, honouring Telegram's retry_after
+            - Sends are paced per chat by a shared limiter that only waits when the chat is over its limit
+            - Retrying per bot never re-sends to chats that already received the message
             - HTML sanitization prevents injection while preserving formatting
         """
         if not self.bots:
             logger.error("No bots configured")
             return False
         
-        success = True
-        for bot in self.bots:
-            try:
-                url = f"https://api.telegram.org/bot{bot['token']}/sendMessage"
-                
-                payload = {
-                    'chat_id': bot['chat_id'],
-                    'text': message,
-                    'parse_mode': parse_mode,
-                    'disable_web_page_preview': disable_preview
-                }
-                
-                response = requests.post(url, json=payload, timeout=30)
-                response.raise_for_status()
-                
-                logger.info("Message sent successfully", bot_name=bot['name'])
-                
-            except requests.exceptions.RequestException as e:
-                logger.error("Failed to send message", bot_name=bot['name'], error=str(e))
-                success = False
-            except Exception as e:
-                logger.error("Unexpected error sending message", bot_name=bot['name'], error=str(e))
-                success = False
+        payload, fallback_payload = self._build_payloads(message, parse_mode, disable_preview, plain_fallback)
+        return all(self._fan_out(self._deliver_to_chat, payload, fallback_payload))
+
+    @staticmethod
+    def _build_payloads(message: str, parse_mode: Optional[str], disable_preview: bool,
+                        plain_fallback: Optional[str]) -> Tuple[Dict, Optional[Dict]]:
+        """sendMessage fields for a message and its plain-text fallback (None without one)"""
+        payload = {
+            'text': message,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': disable_preview
+        }
+        if parse_mode is None:
+            del payload['parse_mode']  # Plain text - Telegram's default
         
-        return success
+        fallback_payload = None
+        if plain_fallback is not None:
+            fallback_payload = {'text': plain_fallback, 'disable_web_page_preview': disable_preview}
+        return payload, fallback_payload
+
+    def _fan_out(self, deliver, *args) -> list:
+        """Run deliver(bots, *args) for every chat concurrently, returning results in chat order"""
+        first_group, *other_groups = self._chat_groups
+        
+        # Chats are independent - send to all at once so latency is the slowest chat, not the sum.
+        # The calling thread takes the first chat itself instead of idling on the pool.
+        futures = [_get_send_executor().submit(deliver, bots, *args) for bots in other_groups]
+        first_result = deliver(first_group, *args)
+        return [first_result] + [future.result() for future in futures]
+
+    async def asend_message(self, message: str, parse_mode: str = "HTML", disable_preview: bool = True,
+                            plain_fallback: Optional[str] = None) -> bool:
+        """Awaitable send_message for callers running an asyncio event loop.
+        
+        Runs the blocking send in a worker thread; bots already go out
+        concurrently on the shared pooled session, so an httpx.AsyncClient path
+        would duplicate the retry, pacing and fallback logic without cutting
+        latency.
+        """
+        return await asyncio.to_thread(self.send_message, message, parse_mode, disable_preview, plain_fallback)
+
+    def _deliver_parts_to_chat(self, bots: List[Dict], parts: List[Tuple[Dict, Optional[Dict]]]) -> List[bool]:
+        """Send a notification's parts to one chat in order, returning which were delivered"""
+        return [self._deliver_to_chat(bots, payload, fallback_payload) for payload, fallback_payload in parts]
+
+    def _deliver_to_chat(self, bots: List[Dict], payload: Dict, fallback_payload: Optional[Dict] = None) -> bool:
+        """Send payload to one chat through the first of its bots that succeeds"""
+        active_bots = [bot for bot in bots if not bot.get('disabled')]
+        for index, bot in enumerate(active_bots):
+            if self._deliver(bot, payload, fallback_payload):
+                return True
+            if index + 1 < len(active_bots):
+                logger.warning("Retrying chat through next bot", failed_bot=bot['name'], next_bot=active_bots[index + 1]['name'])
+        if not active_bots:
+            logger.error("No working bot left for chat", bots=[bot['name'] for bot in bots])
+        return False
+
+    def _deliver(self, bot: Dict, payload: Dict, fallback_payload: Optional[Dict] = None) -> bool:
+        """Send payload through one bot, logging instead of raising on failure"""
+        try:
+            if fallback_payload is not None and self._plain_text_only:
+                # HTML already failed for this channel's summaries - don't pay for another rejected send
+                self._send_to_bot(bot, fallback_payload)
+            else:
+                try:
+                    self._send_to_bot(bot, payload)
+                except TelegramParseError as e:
+                    if fallback_payload is None:
+                        raise
+                    logger.warning("Telegram rejected message formatting, sending plain text", bot_name=bot['name'], error=str(e))
+                    self._plain_text_only = True
+                    self._send_to_bot(bot, fallback_payload)
+            # Per-bot detail - send_video_notification logs each delivered part at info
+            logger.debug("Message sent successfully", bot_name=bot['name'])
+            return True
+        except TelegramPermanentError as e:
+            # Every later part would get the same answer - stop using this bot for this run
+            bot['disabled'] = True
+            logger.error("Telegram refused bot, disabling it for this run", bot_name=bot['name'], error=str(e))
+        except TelegramAPIError as e:
+            logger.error("Failed to send message", bot_name=bot['name'], error=str(e))
+        except requests.exceptions.RequestException as e:
+            # requests puts the URL, and so the token, in connection error messages
+            logger.error("Failed to send message", bot_name=bot['name'], error=str(e).replace(bot['token'], '***'))
+        except Exception as e:
+            logger.error("Unexpected error sending message", bot_name=bot['name'], error=str(e))
+        return False
 
     # @agent:complexity high
     # @agent:side-effects external_api_call,message_delivery,network_io
-    # @agent:retry-policy network_retry_through_send_message
+    # @agent:retry-policy per_bot_retry_through_send_message
     # @agent:performance O(n*m) where n=message_parts, m=configured_bots
     # @agent:security html_sanitization,input_validation
     # @agent:test-coverage critical,integration,message-formatting
@@ -191,8 +516,8 @@ class TelegramService:
         2. Sanitize and split summary content for Telegram limits
         3. Create generic header formatting (no hardcoded channel logic)
         4. Format message with HTML for rich presentation
-        5. Handle multi-part messages with proper sequencing
-        6. Implement fallback to plain text if HTML fails
+        5. Send parts in order per chat, with chats running concurrently
+        6. Fall back to plain text only for bots where Telegram can't parse the HTML
         7. Return overall delivery success status
         
         AI-DECISION: Message formatting strategy
@@ -215,142 +540,145 @@ class TelegramService:
         Performance:
             - Content sanitization: O(n) where n=summary_length
             - Message splitting: O(n) with intelligent boundary detection
-            - Multi-bot delivery: O(bots * message_parts) with network latency
+            - Delivery: O(message_parts) round trips per chat, chats in parallel
             - Total time: 2-10 seconds typical, up to 60s with retries and multiple parts
             
         AI-NOTE: 
             - Removed hardcoded channel-specific formatting for generic architecture
             - HTML formatting with plain text fallback ensures reliable delivery
+            - Each part is sent once; the plain-text variant costs a round trip only on a parse error
             - Message splitting preserves formatting across multiple parts
             - Generic approach works consistently for all channels
         """
         
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
-        
-
+        if not self.bots:
+            logger.error("No bots configured")
+            return False
         
-        # Clean the summary for safe Telegram sending
-        clean_summary = Sanitizer.clean_for_telegram(summary)
-        summary_parts = Sanitizer.split_for_telegram(clean_summary, 3800)  # Leave room for headers
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
         
-        # Create generic header - channel-specific formatting should be in configuration
+        # Generic header - channel-specific formatting comes from configuration
         # AI-DECISION: Message formatting strategy
         # Criteria: Use generic formatting that works for all channels
-        # Channel-specific customization should be handled through:
+        # Channel-specific customization is handled through:
         # 1. Custom prompt templates (for summary style)
-        # 2. Configuration-driven message formatting (future enhancement)
+        # 2. telegram_format in the channel YAML (header/footer, merged in __init__)
         # 3. Bot-specific settings in channel YAML files
-        header = f" New Video from {channel_name}"
-        footer = ""  # No hardcoded hashtags - should be configuration-driven if needed
+        header = self.message_format['header'].replace("{channel_name}", channel_name)
+        footer = self.message_format['footer']
         
-        # Send messages (potentially multiple parts) - Direct MarkdownV2 from LLM
-        success = False
+        # Everything except the summary part is the same for every part - format and escape it once
+        formatted_date = self._format_published_date(published_date) if published_date else None
+        escaped_header = Sanitizer.escape_html(header)
+        escaped_title = Sanitizer.escape_html(video_title)
+        escaped_footer = Sanitizer.escape_html(footer) if footer else ""
+        
+        # Title block (first part) and link block (last part) are the same for
+        # every part - render them once per format and stitch parts together
+        html_top = self._HEADER_HTML.format(escaped_header)
+        html_intro, html_outro = self._render_frame(
+            "HTML", escaped_title, Sanitizer.escape_html(formatted_date), f"<a href=\"{video_url}\">Watch Full Video</a>", escaped_footer)
+        plain_intro, plain_outro = self._render_frame(None, video_title, formatted_date, video_url, footer)
+        
+        # Fill each part up to what its frame actually leaves free (the plain frame
+        # is the longer one once Telegram strips the HTML tags), so long summaries
+        # need as few parts - and round trips - as possible. Only the first part
+        # carries the title block; any part may turn out to be the last, so every
+        # part keeps room for the link block.
+        frame_length = len(header) + len(plain_outro) + _PART_LABEL_ROOM
+        part_budget = max(_MESSAGE_SOFT_LIMIT // 2, _MESSAGE_SOFT_LIMIT - frame_length)
+        first_part_budget = max(_MESSAGE_SOFT_LIMIT // 2, part_budget - len(plain_intro))
+        
+        # Clean the summary for safe Telegram sending; a summary that fits comes back as one part
+        clean_summary = Sanitizer.clean_for_telegram(summary)
+        summary_parts = Sanitizer.split_for_telegram(clean_summary, part_budget, first_part_budget)
         total_parts = len(summary_parts)
+        last_index = total_parts - 1
+        
+        # HTML was already rejected for this channel - don't build what won't be sent
+        plain_only = self._plain_text_only
         
+        part_payloads = []
         for part_index, summary_part in enumerate(summary_parts):
-            part_success = False
-            
-            # Use consistent header (part numbering is handled in the summary content itself)
-            part_header = header
-            
-            # Primary Approach: Convert markdown-style to clean HTML
-            try:
-                # Convert the LLM's markdown-style output to clean HTML
-                clean_summary = Sanitizer.convert_markdown_to_clean_html(summary_part)
-                #    message_header = header
-                
-                # Escape only the header and title
-                escaped_header = Sanitizer.escape_html(header)
-                escaped_title = Sanitizer.escape_html(video_title)
-                escaped_footer = Sanitizer.escape_html(footer) if footer else ""
-                
-                html_message = f"🎬 <b>{escaped_header}</b>\n\n"
-                if part_index == 0:
-                    # Format title with published date if available
-                    if published_date:
-                        # Format date nicely (assuming YYYY-MM-DD format)
-                        try:
-                            from datetime import datetime
-                            date_obj = datetime.strptime(published_date, "%Y-%m-%d")
-                            formatted_date = date_obj.strftime("%B %d, %Y")
-                            html_message += f"📺 <b>{escaped_title}</b>\n"
-                            html_message += f"📅 <i>{formatted_date}</i>\n\n"
-                        except:
-                            # Fallback if date parsing fails
-                            html_message += f"📺 <b>{escaped_title}</b>\n"
-                            html_message += f"📅 <i>{published_date}</i>\n\n"
-                    else:
-                        html_message += f"📺 <b>{escaped_title}</b>\n\n"
-                    html_message += f"━━━━━━━━━━━━━━━━━━━━\n\n"
-                html_message += f"{clean_summary}"
-                if part_index == total_parts - 1:
-                    html_message += f"\n\n━━━━━━━━━━━━━━━━━━━━"
-                    html_message += f"\n🔗 <a href=\"{video_url}\">Watch Full Video</a>"
-                    if escaped_footer:
-                        html_message += f"\n\n{escaped_footer}"
-                
-                # Enable thumbnail preview for the last part (which contains the video link)
-                enable_preview = (part_index == total_parts - 1)
-                self.send_message(html_message, parse_mode="HTML", disable_preview=not enable_preview)
-                logger.info("Sent HTML formatted message part", part=part_index + 1, total_parts=total_parts, channel_name=channel_name)
-                part_success = True
-                
-            except Exception as e:
-                logger.warning("HTML formatting failed, trying fallback", error=str(e))
-                
-                # Fallback: Plain text with minimal formatting
-                try:
-                    # Strip all formatting and send as plain text
-                    plain_summary = Sanitizer.strip_all_formatting(summary_part)
-                    
-                    # Create part-specific header for plain text
-                    if total_parts > 1:
-                        plain_header = f"{header} - Part {part_index + 1}/{total_parts}"
-                    else:
-                        plain_header = header
-                    
-                    plain_message = f"🎬 {plain_header}\n\n"
-                    if part_index == 0:
-                        if published_date:
-                            try:
-                                from datetime import datetime
-                                date_obj = datetime.strptime(published_date, "%Y-%m-%d")
-                                formatted_date = date_obj.strftime("%B %d, %Y")
-                                plain_message += f"📺 {video_title}\n"
-                                plain_message += f"📅 {formatted_date}\n\n"
-                            except:
-                                plain_message += f"📺 {video_title}\n"
-                                plain_message += f"📅 {published_date}\n\n"
-                        else:
-                            plain_message += f"📺 {video_title}\n\n"
-                        plain_message += f"━━━━━━━━━━━━━━━━━━━━\n\n"
-                    plain_message += f"{plain_summary}"
-                    if part_index == total_parts - 1:
-                        plain_message += f"\n\n━━━━━━━━━━━━━━━━━━━━"
-                        plain_message += f"\n🔗 {video_url}"
-                        if footer:
-                            plain_message += f"\n\n{footer}"
-                    
-                    # Enable thumbnail preview for the last part (which contains the video link)
-                    enable_preview = (part_index == total_parts - 1)
-                    self.send_message(plain_message, parse_mode=None, disable_preview=not enable_preview)
-                    logger.info("Sent plain text message part", part=part_index + 1, total_parts=total_parts, channel_name=channel_name)
-                    part_success = True
-                    
-                except Exception as e2:
-                    logger.error("Both HTML and plain text formatting failed", error=str(e2))
-                    part_success = False
+            intro = part_index == 0
+            outro = part_index == last_index
+            # Enable thumbnail preview for the last part (which contains the video link)
+            disable_preview = not outro
+            # Part numbering is handled in the summary content itself, except in plain text
+            plain_header = f"{header} - Part {part_index + 1}/{total_parts}" if total_parts > 1 else header
+            plain_message = "".join((self._HEADER_PLAIN.format(plain_header), plain_intro if intro else "",
+                                     Sanitizer.strip_all_formatting(summary_part), plain_outro if outro else ""))
+            if plain_only:
+                part_payloads.append(self._build_payloads(plain_message, None, disable_preview, None))
+                continue
             
-            if part_success:
+            # Convert the LLM's markdown-style output to clean HTML; the plain-text
+            # version is only sent if Telegram still can't parse the HTML
+            html_message = "".join((html_top, html_intro if intro else "",
+                                    Sanitizer.convert_markdown_to_clean_html(summary_part), html_outro if outro else ""))
+            part_payloads.append(self._build_payloads(html_message, "HTML", disable_preview, plain_message))
+        
+        # Each chat gets its parts in order, but chats don't wait for each other
+        # between parts - a slow chat only delays itself
+        delivered_by_chat = self._fan_out(self._deliver_parts_to_chat, part_payloads)
+        
+        success = False
+        for part_index in range(total_parts):
+            if all(delivered[part_index] for delivered in delivered_by_chat):
+                logger.info("Sent message part", part=part_index + 1, total_parts=total_parts, channel_name=channel_name)
                 success = True
-            
-            # Small delay between parts to avoid rate limiting
-            if part_index < total_parts - 1:
-                time.sleep(1)
+            else:
+                logger.error("Failed to send message part", part=part_index + 1, total_parts=total_parts, channel_name=channel_name)
         
         if success:
             logger.info("Successfully sent notification", channel_name=channel_name)
         else:
             logger.error("Failed to send any message parts", channel_name=channel_name)
         
-        return success
\ No newline at end of file
+        return success
+
+    def submit_video_notification(self, channel_name: str, video_title: str, video_id: str, summary: str,
+                                  published_date: str = None) -> Future:
+        """Queue send_video_notification on a background worker and return its Future.
+        
+        Lets the caller prepare the next video while this one is delivered. Queued
+        notifications from every service go out one at a time, in submission order;
+        the Future resolves to send_video_notification's result.
+        """
+        return _get_notify_executor().submit(self.send_video_notification, channel_name, video_title,
+                                             video_id, summary, published_date)
+
+    async def asend_video_notification(self, channel_name: str, video_title: str, video_id: str, summary: str,
+                                       published_date: str = None) -> bool:
+        """Awaitable send_video_notification, run in a worker thread like asend_message"""
+        return await asyncio.to_thread(self.send_video_notification, channel_name, video_title, video_id,
+                                       summary, published_date)
+
+    @staticmethod
+    def _format_published_date(published_date: str) -> str:
+        """Format a YYYY-MM-DD date for display, passing anything else through unchanged"""
+        try:
+            date_obj = datetime.strptime(published_date, "%Y-%m-%d")
+            return date_obj.strftime("%B %d, %Y")
+        except (ValueError, TypeError):
+            # Fallback if date parsing fails
+            return published_date
+
+    @classmethod
+    def _render_frame(cls, fmt: Optional[str], title: str, formatted_date: Optional[str],
+                      link: str, footer: str) -> Tuple[str, str]:
+        """Title block for the first part and link block for the last; fmt is "HTML" (inputs pre-escaped) or None"""
+        if fmt == "HTML":
+            bold, italic = "<b>{}</b>".format, "<i>{}</i>".format
+        else:
+            bold = italic = str
+        
+        intro = [f"📺 {bold(title)}\n"]
+        if formatted_date:
+            intro.append(f"📅 {italic(formatted_date)}\n")
+        intro.append(cls._INTRO_END)
+        
+        outro = [cls._OUTRO_START, f"\n🔗 {link}"]
+        if footer:
+            outro.append(f"\n\n{footer}")
+        return "".join(intro), "".join(outro)
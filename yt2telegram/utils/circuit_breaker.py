@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Dict
+
+from .logging_config import LoggerFactory
+
+logger = LoggerFactory.create_logger(__name__)
+
+
+# @agent:service-type infrastructure
+# @agent:scalability stateless
+# @agent:persistence memory
+# @agent:priority high
+# @agent:dependencies time
+class CircuitBreaker:
+    """Per-upstream circuit breaker that fails fast while a provider is down.
+    
+    CLOSED: calls pass through; consecutive failures are counted.
+    OPEN: after fail_threshold consecutive failures every call is refused
+          until reset_seconds have passed.
+    HALF_OPEN: a single probe call is let through; success closes the
+               circuit, failure re-opens it for another reset period.
+    
+    Thread-safe - primary and secondary summaries run on separate threads.
+    
+    Example:
+        >>> breaker = CircuitBreaker("openai/gpt-4o")
+        >>> if breaker.allow():
+        ...     try:
+        ...         call_api()
+        ...     except Exception:
+        ...         breaker.record_failure()
+        ...         raise
+        ...     breaker.record_success()
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, fail_threshold: int = 5, reset_seconds: float = 60.0):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Whether a call may be attempted now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+                # Let exactly one probe through; concurrent callers keep failing fast
+                self.state = self.HALF_OPEN
+                logger.info("Circuit half-open, probing upstream", name=self.name)
+                return True
+            return False
+    
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit closed, upstream recovered", name=self.name)
+            self.state = self.CLOSED
+            self._failures = 0
+    
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.fail_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Circuit opened, failing fast",
+                                 name=self.name,
+                                 consecutive_failures=self._failures,
+                                 reset_seconds=self.reset_seconds)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the process-wide breaker for an upstream, creating it on first use"""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            breaker = _BREAKERS[name] = CircuitBreaker(name)
+        return breaker
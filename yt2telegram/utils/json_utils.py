@@ -0,0 +1,32 @@
+import json
+from typing import Any, Union
+
+# orjson is optional - several times faster than the stdlib for the small dicts used here
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to compact JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    # Match orjson's output: no padding whitespace, non-ASCII kept as-is
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, e.g. for an HTTP request body"""
+    if ORJSON_AVAILABLE:
+        # orjson already produces UTF-8 bytes - skip the decode/encode round trip of dumps()
+        return orjson.dumps(obj)
+    return dumps(obj).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
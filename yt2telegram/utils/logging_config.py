@@ -216,8 +216,16 @@ class StructuredLogger:
         
         return message
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a standard logging level would be emitted (lets callers skip building kwargs)"""
+        if RICH_AVAILABLE:
+            return self._rich_logger.isEnabledFor(level)
+        return self._fallback_logger.isEnabledFor(level)
+    
     def debug(self, message: str, **kwargs):
         """Log debug message"""
+        if not self.isEnabledFor(logging.DEBUG):
+            return  # Skip formatting kwargs for records that would be dropped
         if RICH_AVAILABLE:
             formatted_msg = self._format_rich_message(message, **kwargs)
             self._rich_logger.debug(formatted_msg)
@@ -227,6 +235,8 @@ class StructuredLogger:
     
     def info(self, message: str, **kwargs):
         """Log info message"""
+        if not self.isEnabledFor(logging.INFO):
+            return
         if RICH_AVAILABLE:
             formatted_msg = self._format_rich_message(message, **kwargs)
             self._rich_logger.info(formatted_msg)
@@ -236,6 +246,8 @@ class StructuredLogger:
     
     def warn(self, message: str, **kwargs):
         """Log warning message"""
+        if not self.isEnabledFor(logging.WARNING):
+            return
         if RICH_AVAILABLE:
             formatted_msg = self._format_rich_message(message, **kwargs)
             self._rich_logger.warning(formatted_msg)
@@ -249,6 +261,8 @@ class StructuredLogger:
     
     def error(self, message: str, **kwargs):
         """Log error message"""
+        if not self.isEnabledFor(logging.ERROR):
+            return
         if RICH_AVAILABLE:
             formatted_msg = self._format_rich_message(message, **kwargs)
             self._rich_logger.error(formatted_msg)
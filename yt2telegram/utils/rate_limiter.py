@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict
+
+from .logging_config import LoggerFactory
+
+logger = LoggerFactory.create_logger(__name__)
+
+
+# @agent:service-type infrastructure
+# @agent:scalability stateless
+# @agent:persistence memory
+# @agent:priority medium
+# @agent:dependencies asyncio
+class TokenRateLimiter:
+    """Token bucket that keeps asyncio callers under a tokens-per-minute budget.
+
+    The bucket holds at most one minute of budget and refills continuously, so
+    a burst up to the full limit goes out at once and later requests are paced
+    at tokens_per_minute / 60 per second. Waiters are served in arrival order.
+
+    Example:
+        >>> limiter = TokenRateLimiter(100_000)
+        >>> await limiter.acquire(estimated_tokens)
+        >>> await call_api()
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        if tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        self.capacity = float(tokens_per_minute)
+        self.refill_per_second = tokens_per_minute / 60.0
+        self._available = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._available = min(self.capacity, self._available + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    async def acquire(self, tokens: int):
+        """Wait until tokens can be spent without exceeding the per-minute budget"""
+        # A single request larger than the whole budget waits for a full bucket instead of forever
+        tokens = min(float(tokens), self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._available < tokens:
+                wait_seconds = (tokens - self._available) / self.refill_per_second
+                logger.debug("Rate limit reached, waiting", tokens=tokens, wait_seconds=round(wait_seconds, 2))
+                await asyncio.sleep(wait_seconds)
+                self._refill()
+            self._available -= tokens
+
+
+# @agent:service-type infrastructure
+# @agent:scalability stateless
+# @agent:persistence memory
+# @agent:priority medium
+# @agent:dependencies threading
+class ChatRateLimiter:
+    """Sliding-window send limiter for Telegram's per-chat and global message limits.
+
+    Thread-safe, for the blocking senders in TelegramService. A send is admitted
+    as soon as both the chat and the whole process are under their limits for
+    the last window_seconds, so well-spaced sends never wait.
+
+    Example:
+        >>> limiter = ChatRateLimiter(per_chat=1, global_limit=30)
+        >>> limiter.acquire(chat_id)
+        >>> session.post(url, json=payload)
+    """
+
+    def __init__(self, per_chat: int = 1, global_limit: int = 30, window_seconds: float = 1.0):
+        self.per_chat = per_chat
+        self.global_limit = global_limit
+        self.window_seconds = window_seconds
+        self._chat_sends: Dict[str, Deque[float]] = defaultdict(deque)
+        self._global_sends: Deque[float] = deque()
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _wait_seconds(self, sends: Deque[float], limit: int, now: float) -> float:
+        while sends and sends[0] <= now - self.window_seconds:
+            sends.popleft()
+        if len(sends) < limit:
+            return 0.0
+        return sends[0] + self.window_seconds - now
+
+    def pause(self, chat_id: str, seconds: float):
+        """Hold every send to chat_id for seconds, e.g. after Telegram's 429 retry_after"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused_until[chat_id] = max(until, self._paused_until.get(chat_id, 0.0))
+
+    def acquire(self, chat_id: str):
+        """Block until a message may be sent to chat_id, then record the send"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                chat_sends = self._chat_sends[chat_id]
+                wait_seconds = max(self._wait_seconds(chat_sends, self.per_chat, now),
+                                   self._wait_seconds(self._global_sends, self.global_limit, now),
+                                   self._paused_until.get(chat_id, now) - now)
+                if wait_seconds <= 0:
+                    chat_sends.append(now)
+                    self._global_sends.append(now)
+                    return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Telegram send rate limit reached, waiting", wait_seconds=round(wait_seconds, 2))
+            time.sleep(wait_seconds)
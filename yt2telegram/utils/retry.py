@@ -1,8 +1,10 @@
+import random
 import time
 from functools import wraps
-from typing import Callable, Type, Union, Tuple
+from typing import Callable, Optional, Type, Union, Tuple
 
 from .logging_config import LoggerFactory
+from ..exceptions import CircuitOpenError, DeadlineExceededError
 
 logger = LoggerFactory.create_logger(__name__)
 
@@ -16,7 +18,10 @@ def retry(
     delay: float = 1.0,
     backoff: float = 1.0,
     exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
-    logger_name: str = None
+    logger_name: str = None,
+    fail_fast: Tuple[Type[Exception], ...] = (),
+    jitter: float = 0.0,
+    max_delay: Optional[float] = None
 ):
     """Advanced retry decorator with exponential backoff and comprehensive error handling.
     
@@ -39,7 +44,7 @@ def retry(
     1. Execute function and capture any exceptions
     2. If success → return result immediately
     3. If exception matches retry criteria → wait and retry
-    4. Apply exponential backoff between attempts
+    4. Apply exponential backoff between attempts, stretched by random jitter
     5. After max attempts → raise last exception with context
     
     AI-DECISION: Retry strategy selection
@@ -55,6 +60,9 @@ def retry(
         backoff (float): Multiplier for delay after each attempt (default: 1.0)
         exceptions (Union[Type[Exception], Tuple]): Exception types to retry on
         logger_name (str): Custom logger name for retry events
+        fail_fast (Tuple): Exception types re-raised immediately even if they match exceptions
+        jitter (float): Each wait is stretched by a random 0..jitter fraction (default: 0.0)
+        max_delay (Optional[float]): Cap on any single wait in seconds (default: no cap)
     
     Returns:
         Callable: Decorated function with retry capability
@@ -74,6 +82,7 @@ def retry(
         - Specific exception handling prevents infinite retries on permanent failures
         - Logging provides visibility into retry patterns for optimization
         - Backoff multiplier should typically be 1.5-2.0 for optimal spacing
+        - Jitter de-correlates callers that failed together (e.g. during an outage)
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -94,11 +103,16 @@ def retry(
                     
                     return result
                     
+                except fail_fast:
+                    raise
                 except exceptions as e:
                     last_exception = e
                     attempt_num = attempt + 1
                     
                     if attempt_num < attempts:
+                        wait_seconds = current_delay * (1 + random.uniform(0, jitter)) if jitter else current_delay
+                        if max_delay is not None:
+                            wait_seconds = min(wait_seconds, max_delay)
                         # Not the last attempt - log warning and retry
                         func_logger.warning(
                             "Function attempt failed, retrying", 
@@ -106,9 +120,9 @@ def retry(
                             attempt=attempt_num, 
                             total_attempts=attempts, 
                             error=str(e), 
-                            retry_delay=current_delay
+                            retry_delay=round(wait_seconds, 2)
                         )
-                        time.sleep(current_delay)
+                        time.sleep(wait_seconds)
                         current_delay *= backoff
                     else:
                         # Last attempt failed - log error and re-raise
@@ -135,7 +149,9 @@ class RetryConfig:
         'attempts': 3,
         'delay': 2.0,
         'backoff': 1.5,
-        'exceptions': (ConnectionError, TimeoutError, OSError)
+        'exceptions': (ConnectionError, TimeoutError, OSError),
+        'jitter': 0.5,  # Spread out retries from callers that failed together
+        'max_delay': 30.0
     }
     
     # File operations
@@ -151,7 +167,9 @@ class RetryConfig:
         'attempts': 3,
         'delay': 5.0,
         'backoff': 2.0,
-        'exceptions': Exception  # Catch all for external APIs
+        'exceptions': Exception,  # Catch all for external APIs
+        'fail_fast': (CircuitOpenError, DeadlineExceededError),  # Retrying only adds delay
+        'jitter': 0.5
     }
     
     # Quick operations that should fail fast
@@ -163,7 +181,12 @@ class RetryConfig:
     }
 
 def network_retry(func: Callable) -> Callable:
-    """Shorthand decorator for network operations"""
+    """Shorthand decorator for network operations.
+    
+    Retries re-run the whole function, so use it on calls with a single target.
+    A function that sends to several targets would re-send to the ones that
+    already succeeded - retry per target instead (see TelegramService._send_to_bot).
+    """
     return retry(**RetryConfig.NETWORK)(func)
 
 def file_retry(func: Callable) -> Callable:
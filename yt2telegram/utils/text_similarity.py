@@ -0,0 +1,69 @@
+import math
+import re
+from collections import Counter
+from typing import List
+
+# Word tokens, Unicode-aware so Russian/German transcripts score the same way as English
+_WORD_RE = re.compile(r'\w+')
+
+# Very short tokens are mostly stopwords and add noise to the vectors
+_MIN_TERM_LENGTH = 3
+
+# Sentence boundaries - auto-generated subtitles often have none, see split_passages
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def term_vector(text: str) -> Counter:
+    """Build a bag-of-words term-frequency vector for text"""
+    if not text:
+        return Counter()
+    return Counter(word for word in _WORD_RE.findall(text.lower()) if len(word) >= _MIN_TERM_LENGTH)
+
+
+def _norm(vec: Counter) -> float:
+    return math.sqrt(sum(count * count for count in vec.values()))
+
+
+def cosine_similarity(vec_a: Counter, vec_b: Counter) -> float:
+    """Cosine similarity between two term-frequency vectors (0.0 for empty input)"""
+    if not vec_a or not vec_b:
+        return 0.0
+
+    # Iterate the smaller vector - only shared terms contribute to the dot product
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    dot = sum(count * vec_b[term] for term, count in vec_a.items() if term in vec_b)
+    if not dot:
+        return 0.0
+
+    return dot / (_norm(vec_a) * _norm(vec_b))
+
+
+def similarity_scores(texts: List[str], reference: str) -> List[float]:
+    """Cosine similarity of each text to one reference text.
+    
+    Equivalent to cosine_similarity(term_vector(text), term_vector(reference))
+    per text, but the reference vector and its norm are built once and each
+    text only walks its own (short) vector.
+    """
+    reference_vector = term_vector(reference)
+    if not reference_vector:
+        return [0.0] * len(texts)
+    reference_norm = _norm(reference_vector)
+
+    scores = []
+    for text in texts:
+        vector = term_vector(text)
+        dot = sum(count * reference_vector[term] for term, count in vector.items() if term in reference_vector)
+        scores.append(dot / (_norm(vector) * reference_norm) if dot else 0.0)
+    return scores
+
+
+def split_passages(text: str, max_words: int = 40) -> List[str]:
+    """Split text into sentences, breaking unpunctuated runs into max_words windows"""
+    passages = []
+    for sentence in _SENTENCE_END_RE.split(text):
+        words = sentence.split()
+        for start in range(0, len(words), max_words):
+            passages.append(' '.join(words[start:start + max_words]))
+    return passages
@@ -1,5 +1,38 @@
 import re
-from typing import Any, List
+from typing import Any, List, Optional
+
+# Bot tokens are "<bot id>:<secret>"; the secret is 35 characters today, but
+# Telegram doesn't promise a length, so only require that it looks like one
+_BOT_TOKEN_RE = re.compile(r'^\d+:[A-Za-z0-9_-]{30,}$')
+
+# Numeric chat IDs (negative for groups/channels) or a public @channelusername
+_CHAT_TARGET_RE = re.compile(r'^-?\d+$|^@[A-Za-z0-9_]{5,}$')
+
+# Telegram HTML escapes (https://core.telegram.org/bots/api#html-style) as one
+# str.translate table - a single C-level pass, and '&' can't be double-escaped
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# MarkdownV2 reserved characters, each escaped with a backslash
+_MARKDOWN_V2_ESCAPE_TABLE = str.maketrans({char: f"\\{char}" for char in r'_*[]()~`>#+-=|{}.!'})
+
+# Single characters clean_for_telegram drops (markdown/table syntax Telegram
+# would show literally) or turns into spaces (table separators), in one pass
+_TELEGRAM_CHAR_TABLE = str.maketrans({**dict.fromkeys('~{}+=[]'), '|': ' '})
+
+# Sanitizer runs on every summary and every part - compile its patterns once
+# rather than going through the re module's cache lookup on each call
+_YOUTUBE_CHANNEL_ID_RE = re.compile(r'^UC[a-zA-Z0-9_-]{22}$')
+_HORIZONTAL_RULE_RE = re.compile(r'[-]{3,}')
+_BLOCKQUOTE_RE = re.compile(r'>\s*')
+_SPACES_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_ELLIPSIS_RE = re.compile(r'\.{3,}')
+_EXCLAMATIONS_RE = re.compile(r'!{2,}')
+_QUESTION_MARKS_RE = re.compile(r'\?{2,}')
+_DASHES_RE = re.compile(r'--+')
+_MD_BOLD_RE = re.compile(r'\*\*([^*\n]+?)\*\*')
+_MD_CODE_RE = re.compile(r'`([^`\n]+?)`')
+_PART_LABEL_RE = re.compile(r'📄 Part (\d+)/(\d+)')
 
 class ValidationError(Exception):
     """Custom exception for validation failures with detailed error context."""
@@ -81,6 +114,43 @@ class InputValidator:
         except (ValueError, TypeError):
             raise ValidationError(f"Invalid chat ID format: {chat_id}")
     
+    # @agent:complexity low
+    # @agent:side-effects none
+    # @agent:performance O(1) with precompiled_regex
+    # @agent:security input_validation,token_protection
+    @staticmethod
+    def validate_telegram_bot_token(token: str) -> str:
+        """Validate the shape of a Telegram bot token.
+        
+        A malformed token gets a 401/404 from Telegram on every send, so it is
+        cheaper to reject it once at startup. The error never includes the
+        token itself.
+        
+        Raises:
+            ValidationError: If token is not "<digits>:<secret>"
+        """
+        if not isinstance(token, str) or not _BOT_TOKEN_RE.match(token):
+            raise ValidationError("Invalid Telegram bot token format")
+        return token
+    
+    # @agent:complexity low
+    # @agent:side-effects none
+    # @agent:performance O(1) with precompiled_regex
+    # @agent:security input_validation
+    @staticmethod
+    def validate_telegram_chat_target(chat_id: str) -> str:
+        """Validate a sendMessage chat_id: numeric ID or @channelusername.
+        
+        Unlike validate_telegram_chat_id, public channel usernames are allowed
+        and the value is returned unchanged as a string.
+        
+        Raises:
+            ValidationError: If chat_id is neither form
+        """
+        if not isinstance(chat_id, str) or not _CHAT_TARGET_RE.match(chat_id):
+            raise ValidationError("Invalid Telegram chat ID format")
+        return chat_id
+    
     # @agent:complexity medium
     # @agent:side-effects none
     # @agent:performance O(1) with regex_matching
@@ -122,7 +192,7 @@ class InputValidator:
             raise ValidationError("Channel ID must be a non-empty string")
         
         # YouTube channel IDs are typically 24 characters starting with UC
-        if not re.match(r'^UC[a-zA-Z0-9_-]{22}$', channel_id):
+        if not _YOUTUBE_CHANNEL_ID_RE.match(channel_id):
             raise ValidationError(f"Invalid YouTube channel ID format: {channel_id}")
         
         return channel_id
@@ -136,18 +206,7 @@ class Sanitizer:
         if not text:
             return text
         
-        # Telegram HTML formatting requires escaping these characters
-        # According to: https://core.telegram.org/bots/api#html-style
-        html_escapes = {
-            '&': '&amp;',   # Must be first to avoid double-escaping
-            '<': '&lt;',
-            '>': '&gt;',
-        }
-        
-        for char, escape in html_escapes.items():
-            text = text.replace(char, escape)
-        
-        return text
+        return text.translate(_HTML_ESCAPE_TABLE)
     
     @staticmethod
     def escape_markdown_v2(text: str) -> str:
@@ -158,16 +217,8 @@ class Sanitizer:
         # According to Telegram Bot API, these characters must be escaped in MarkdownV2:
         # _*[]()~`>#+-=|{}.!
         # But we need to be careful not to escape characters that are part of formatting
-        escape_chars = r'_*[]()~`>#+-=|{}.!'
-        escaped_text = ""
-        
-        for char in text:
-            if char in escape_chars:
-                escaped_text += f"\\{char}"
-            else:
-                escaped_text += char
-        
-        return escaped_text
+        # One translate pass instead of growing a string character by character
+        return text.translate(_MARKDOWN_V2_ESCAPE_TABLE)
     
 
     
@@ -178,26 +229,22 @@ class Sanitizer:
             return text
         
         # Clean problematic patterns while preserving markdown
-        text = re.sub(r'[~{}+=\[\]]', '', text)  # Remove special chars
-        text = re.sub(r'[|]', ' ', text)  # Remove table separators
-        text = re.sub(r'[-]{3,}', '\n━━━━━━━━━━\n', text)  # Convert horizontal rules to visual separator
-        text = re.sub(r'>\s*', '', text, flags=re.MULTILINE)  # Remove blockquotes
+        text = text.translate(_TELEGRAM_CHAR_TABLE)  # Remove special chars and table separators
+        text = _HORIZONTAL_RULE_RE.sub('\n━━━━━━━━━━\n', text)  # Convert horizontal rules to visual separator
+        text = _BLOCKQUOTE_RE.sub('', text)  # Remove blockquotes
         
         # Fix spacing issues
-        text = re.sub(r'[ \t]+', ' ', text)  # Normalize spaces/tabs but keep newlines
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Max 2 consecutive newlines
+        text = _SPACES_RE.sub(' ', text)  # Normalize spaces/tabs but keep newlines
+        text = _BLANK_LINES_RE.sub('\n\n', text)  # Max 2 consecutive newlines
         
         # Fix punctuation
-        text = re.sub(r'\.{3,}', '...', text)  # Normalize ellipsis
-        text = re.sub(r'!{2,}', '!', text)  # Single exclamation
-        text = re.sub(r'\?{2,}', '?', text)  # Single question mark
-        text = re.sub(r'--+', ' — ', text)  # Replace dashes with em-dash
+        text = _ELLIPSIS_RE.sub('...', text)  # Normalize ellipsis
+        text = _EXCLAMATIONS_RE.sub('!', text)  # Single exclamation
+        text = _QUESTION_MARKS_RE.sub('?', text)  # Single question mark
+        text = _DASHES_RE.sub(' — ', text)  # Replace dashes with em-dash
         
-        # Final cleanup
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
-        text = text.strip()
-        
-        return text
+        # Blank-line runs were already collapsed above - the punctuation fixes add no newlines
+        return text.strip()
     
 
     @staticmethod
@@ -206,26 +253,34 @@ class Sanitizer:
         if not text:
             return text
         
+        # Escape first, in one pass over the whole text: the markdown markers
+        # below contain no HTML special characters, so they survive escaping,
+        # and a literal "<b>" in the summary can no longer pass through as a tag
+        text = Sanitizer.escape_html(text)
+        
+        # Plain prose (common) has no markers - skip both regex passes
+        if '*' not in text and '`' not in text:
+            return text
+        
         # Convert **bold** to <b>bold</b>
-        text = re.sub(r'\*\*([^*\n]+?)\*\*', r'<b>\1</b>', text)
+        text = _MD_BOLD_RE.sub(r'<b>\1</b>', text)
         
         # Convert `code` to <code>code</code>
-        text = re.sub(r'`([^`\n]+?)`', r'<code>\1</code>', text)
-        
-        # Escape any remaining HTML characters in the text
-        # But preserve our newly created <b> and <code> tags
-        parts = re.split(r'(</?(?:b|code)>)', text)
-        escaped_parts = []
-        
-        for part in parts:
-            if part in ['<b>', '</b>', '<code>', '</code>']:
-                escaped_parts.append(part)
-            else:
-                # Escape HTML in regular text but preserve line breaks and structure
-                escaped_part = part.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                escaped_parts.append(escaped_part)
-        
-        return ''.join(escaped_parts)
+        text = _MD_CODE_RE.sub(r'<code>\1</code>', text)
+        
+        return text
+    
+    @staticmethod
+    def strip_all_formatting(text: str) -> str:
+        """Remove markdown bold/code markers so text reads cleanly as plain text"""
+        if not text:
+            return text
+        
+        if '*' in text:
+            text = _MD_BOLD_RE.sub(r'\1', text)
+        if '`' in text:
+            text = _MD_CODE_RE.sub(r'\1', text)
+        return text
     
     @staticmethod
     def validate_telegram_message(text: str) -> bool:
@@ -242,9 +297,15 @@ class Sanitizer:
         return True
     
     @staticmethod
-    def split_for_telegram(text: str, max_length: int = 3800) -> List[str]:
-        """Split text into multiple messages that fit Telegram's limits while preserving all content"""
-        if len(text) <= max_length:
+    def split_for_telegram(text: str, max_length: int = 3800, first_max_length: Optional[int] = None) -> List[str]:
+        """Split text into multiple messages that fit Telegram's limits while preserving all content.
+        
+        first_max_length caps the first part (and text returned whole) separately,
+        for callers that put extra content only in front of the first message.
+        """
+        if first_max_length is None:
+            first_max_length = max_length
+        if len(text) <= first_max_length:
             return [text]
         
         messages = []
@@ -252,7 +313,8 @@ class Sanitizer:
         part_number = 1
         
         while remaining_text:
-            if len(remaining_text) <= max_length:
+            part_limit = max_length if messages else first_max_length
+            if len(remaining_text) <= part_limit:
                 # Last part
                 if len(messages) > 0:  # Only add part number if there are multiple parts
                     messages.append(f"📄 Part {part_number}/{part_number}\n\n{remaining_text}")
@@ -261,7 +323,7 @@ class Sanitizer:
                 break
             
             # Find the best split point
-            chunk = remaining_text[:max_length]
+            chunk = remaining_text[:part_limit]
             
             # Look for good split points in order of preference
             split_points = [
@@ -273,9 +335,9 @@ class Sanitizer:
                 (chunk.rfind(' '), 'word')           # Word boundary
             ]
             
-            split_pos = max_length
+            split_pos = part_limit
             for pos, split_type in split_points:
-                if pos > max_length * 0.6:  # Keep at least 60% of chunk
+                if pos > part_limit * 0.6:  # Keep at least 60% of chunk
                     split_pos = pos + (1 if split_type == 'sentence' else 0)
                     break
             
@@ -295,9 +357,7 @@ class Sanitizer:
         if actual_total > 1:
             for i in range(len(messages)):
                 # Replace the estimated total with the actual total
-                old_pattern = re.search(r'📄 Part (\d+)/(\d+)', messages[i])
-                if old_pattern:
-                    messages[i] = re.sub(r'📄 Part (\d+)/(\d+)', f'📄 Part {i+1}/{actual_total}', messages[i], 1)
+                messages[i] = _PART_LABEL_RE.sub(f'📄 Part {i+1}/{actual_total}', messages[i], 1)
         
         return messages
     